@@ -1,30 +1,122 @@
 # Emerald Dashboard - Main Application Entry Point
-from dash import Dash
 import os
 
-from config import EXTERNAL_SCRIPTS, DEBUG, PORT
-from layout import create_layout
+from config import (
+    TAILWIND_CDN, DEBUG, PORT, LAZY_PAGES, STARTUP_PROFILE, RESPONSE_COMPRESSION, LAYOUT_CACHE, SSR_SHELL,
+    CALLBACK_METRICS, CALLBACK_PROFILER,
+)
+from startup import StartupProfiler
+
+profiler = StartupProfiler(enabled=STARTUP_PROFILE)
+
+with profiler.phase('import dash'):
+    from dash import Dash
+with profiler.phase('import emerald_ui_components'):
+    import emerald_ui_components  # noqa: F401
+with profiler.phase('import layout'):
+    from layout import create_layout
+with profiler.phase('import pages_loader'):
+    from pages_loader import load_pages
+from avatars import register_avatar_routes
+from components.sidebar import NAV_MENU_CACHE
+from health import HEALTH, init_health
+from layout_cache import init_layout_cache
+from navigation import NAV_INDEX
+from query_cache import QUERY_CACHE
+from shell import inject_shell
+from static_assets import asset_url, has_built_assets, register_static_assets
 
 # Import callbacks to register them with the app
-import callbacks  # noqa: F401
+with profiler.phase('import callbacks'):
+    import callbacks  # noqa: F401
 
 # Load custom index template with inline loader
 with open(os.path.join(os.path.dirname(__file__), 'assets', 'index_template.html'), 'r') as f:
     index_string = f.read()
 
+# In production, serve the compiled, hashed CSS and favicon from build_assets.py
+# instead of the raw files in assets/ - without a build, Tailwind comes from the CDN
+use_built_assets = has_built_assets() and not DEBUG
+if use_built_assets:
+    index_string = index_string.replace(
+        '{%favicon%}', f'<link rel="icon" type="image/x-icon" href="{asset_url("favicon.ico")}">'
+    )
+
+# Pre-render the sidebar/header shell and asset preload hints into the index page
+base_index_string = index_string
+index_string = inject_shell(base_index_string, enabled=SSR_SHELL)
+
 # Create the Dash application
-app = Dash(
-    __name__,
-    external_scripts=EXTERNAL_SCRIPTS,
-    use_pages=True,
-    pages_folder='pages',
-    index_string=index_string,
-    suppress_callback_exceptions=True
-)
+# Pages are registered below by load_pages (pages_folder='' stops Dash importing them itself)
+with profiler.phase('create app'):
+    app = Dash(
+        __name__,
+        external_scripts=[] if use_built_assets else [TAILWIND_CDN],
+        external_stylesheets=[asset_url('app.css')] if use_built_assets else [],
+        assets_ignore=r'.*\.css$' if use_built_assets else '',
+        use_pages=True,
+        pages_folder='',
+        index_string=index_string,
+        suppress_callback_exceptions=True
+    )
+
+init_health(app.server)
+register_static_assets(app.server)
+register_avatar_routes(app.server)
+
+if RESPONSE_COMPRESSION:
+    from compression import init_compression
+    init_compression(app.server)
+
+# Per-callback latency/payload metrics (after compression so uncompressed sizes are recorded)
+if CALLBACK_METRICS:
+    from background import drain_job_timings
+    from db_pool import pool_gauges
+    from metrics import init_callback_metrics
+    from supersede import LATEST_REQUESTS
+    callback_metrics = init_callback_metrics(app)
+    # Background jobs run in other processes and report their times through the shared cache
+    callback_metrics.register_source(drain_job_timings)
+    callback_metrics.register_gauges('db_pool', pool_gauges)
+    callback_metrics.register_gauges('superseded_requests', LATEST_REQUESTS.stats)
+
+# Opt-in sampling profiler for selected callback requests (viewed on /dev/metrics)
+if CALLBACK_PROFILER:
+    from profiler import init_callback_profiler
+    init_callback_profiler(app)
+
+# Register pages - in lazy mode, simple page modules are imported on first visit
+load_pages(os.path.join(os.path.dirname(__file__), 'pages'), lazy=LAZY_PAGES, profiler=profiler)
+HEALTH.pages_registered = True
 
 # Set the layout
-app.layout = create_layout()
+with profiler.phase('build layout'):
+    app.layout = create_layout()
+HEALTH.layout_ready = True
+
+# Serve layout/dependencies JSON from cache with ETags (rebuilt when pages or callbacks change)
+layout_cache = init_layout_cache(app) if LAYOUT_CACHE else None
+
+
+@NAV_INDEX.on_rebuild
+def rebuild_layout():
+    """Rebuild the layout and pre-rendered shell from the edited nav config."""
+    app.index_string = inject_shell(base_index_string, enabled=SSR_SHELL)
+    # A new layout object also changes the layout response cache's fingerprint
+    app.layout = create_layout()
+
+
+# Cache warm state shown by the readiness endpoint
+HEALTH.register_cache('nav_menu', NAV_MENU_CACHE.stats)
+if layout_cache is not None:
+    HEALTH.register_cache('layout_response', layout_cache.stats)
+HEALTH.register_cache('query_results', QUERY_CACHE.stats)
+
+profiler.print_report()
+
+# WSGI entry point for production servers (gunicorn app:server)
+server = app.server
 
-# Run the server
+# Run the development server
 if __name__ == "__main__":
     app.run(debug=DEBUG, host='0.0.0.0', port=PORT)
@@ -0,0 +1,116 @@
+# Local avatar proxy: fetch each user's avatar once, resize to rendered sizes, serve from disk
+import io
+import os
+import threading
+import time
+import urllib.request
+
+from flask import abort, send_file
+from PIL import Image
+
+from config import AVATAR_CACHE_DIR, USER_AVATAR_SOURCE
+
+# Header avatars render at 24px (h-6); a single 48px image covers 1x and 2x displays
+AVATAR_SIZES = (48,)
+
+# Avatars are re-fetched after AVATAR_MAX_AGE on disk; browsers may cache for a day
+AVATAR_MAX_AGE = 24 * 60 * 60
+
+# Don't retry a failing source more often than this (the UI shows initials meanwhile)
+RETRY_AFTER = 5 * 60
+
+# Where each user's avatar comes from: http(s) URL, file:// URL or local path
+AVATAR_SOURCES = {
+    'andy-neale': USER_AVATAR_SOURCE,
+}
+
+_locks_lock = threading.Lock()
+_locks = {}     # user id -> lock held while that user's avatar is fetched
+_failures = {}  # user id -> time of last failed fetch
+
+
+def user_lock(user_id: str) -> threading.Lock:
+    """Get the lock for one user's avatar, so a slow source only blocks requests for that user."""
+    with _locks_lock:
+        return _locks.setdefault(user_id, threading.Lock())
+
+
+def avatar_url(user_id: str, size: int = 48) -> str:
+    """Get the local URL of a user's avatar at a given size."""
+    return f'/avatars/{user_id}/{size}.png'
+
+
+def avatar_path(user_id: str, size: int) -> str:
+    """Get the on-disk path of a resized avatar."""
+    return os.path.join(AVATAR_CACHE_DIR, user_id, f'{size}.png')
+
+
+def read_source(source: str) -> bytes:
+    """Read image bytes from a URL or local file (the stand-in source for tests)."""
+    if source.startswith(('http://', 'https://')):
+        with urllib.request.urlopen(source, timeout=5) as response:
+            return response.read()
+    if source.startswith('file://'):
+        source = source[len('file://'):]
+    with open(source, 'rb') as f:
+        return f.read()
+
+
+def ingest_avatar(user_id: str, source: str):
+    """Fetch an avatar once and store a square PNG for each rendered size."""
+    image = Image.open(io.BytesIO(read_source(source))).convert('RGBA')
+
+    # Center-crop to a square before resizing
+    side = min(image.size)
+    left, top = (image.width - side) // 2, (image.height - side) // 2
+    image = image.crop((left, top, left + side, top + side))
+
+    os.makedirs(os.path.join(AVATAR_CACHE_DIR, user_id), exist_ok=True)
+    for size in AVATAR_SIZES:
+        path = avatar_path(user_id, size)
+        image.resize((size, size), Image.LANCZOS).save(path + '.tmp', format='PNG', optimize=True)
+        os.replace(path + '.tmp', path)
+
+
+def ensure_avatar(user_id: str, size: int) -> bool:
+    """Make sure a fresh resized avatar is on disk; False if it can't be fetched."""
+    path = avatar_path(user_id, size)
+    if os.path.isfile(path) and time.time() - os.path.getmtime(path) < AVATAR_MAX_AGE:
+        return True
+
+    with user_lock(user_id):
+        if os.path.isfile(path) and time.time() - os.path.getmtime(path) < AVATAR_MAX_AGE:
+            return True
+        if time.time() - _failures.get(user_id, 0) < RETRY_AFTER:
+            return os.path.isfile(path)
+        try:
+            ingest_avatar(user_id, AVATAR_SOURCES[user_id])
+        except Exception:
+            _failures[user_id] = time.time()
+            # Serve a stale copy if there is one
+            return os.path.isfile(path)
+    return True
+
+
+def serve_avatar(user_id: str, size: int):
+    """Serve a resized avatar; 404 makes AvatarImage fall back to AvatarFallback initials."""
+    if user_id not in AVATAR_SOURCES or size not in AVATAR_SIZES:
+        abort(404)
+    if not ensure_avatar(user_id, size):
+        abort(404)
+    return send_file(
+        avatar_path(user_id, size),
+        mimetype='image/png',
+        conditional=True,
+        etag=True,
+        max_age=AVATAR_MAX_AGE,
+    )
+
+
+def register_avatar_routes(server):
+    """Add the avatar route to the Flask server."""
+    server.add_url_rule(
+        '/avatars/<user_id>/<int:size>.png',
+        endpoint='avatar',
+        view_func=serve_avatar,
+    )
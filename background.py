@@ -0,0 +1,61 @@
+# Background callback manager: long callbacks run in separate processes with results in a shared disk cache
+import functools
+import time
+
+import diskcache
+from dash import DiskcacheManager
+from dash.exceptions import PreventUpdate
+
+from config import BACKGROUND_CACHE_DIR, BACKGROUND_RESULT_EXPIRE, CALLBACK_METRICS, CALLBACK_PROFILER
+from profiler import profile_call, profile_reason
+
+# Queue (in the shared cache) of finished job timings, since job processes can't reach a worker's metrics
+JOB_TIMINGS = 'callback-timings'
+
+BACKGROUND_CACHE = diskcache.Cache(BACKGROUND_CACHE_DIR)
+
+# Progress and results are read back by whichever worker the renderer's polling request reaches
+BACKGROUND_MANAGER = DiskcacheManager(BACKGROUND_CACHE, expire=BACKGROUND_RESULT_EXPIRE)
+
+
+def instrument_job(func):
+    """Time a background callback inside its job process, profiling it when selected.
+
+    Place it under @callback. The duration is queued for drain_job_timings();
+    profiles go straight to the shared profile store.
+    """
+    @functools.wraps(func)
+    def job(*args, **kwargs):
+        name = func.__name__
+        reason = profile_reason(name) if CALLBACK_PROFILER else None
+        start = time.perf_counter()
+        error = True
+        try:
+            if reason is None:
+                result = func(*args, **kwargs)
+            else:
+                body = {'inputs': args, 'state': kwargs}
+                result = profile_call(name, reason, body, lambda: func(*args, **kwargs))
+            error = False
+            return result
+        except PreventUpdate:
+            error = False
+            raise
+        finally:
+            if CALLBACK_METRICS:
+                timing = (name, (time.perf_counter() - start) * 1000, error, time.time())
+                try:
+                    BACKGROUND_CACHE.push(timing, prefix=JOB_TIMINGS, expire=BACKGROUND_RESULT_EXPIRE)
+                except diskcache.Timeout:
+                    pass
+    return job
+
+
+def drain_job_timings() -> list:
+    """Pop the queued (name, elapsed_ms, error, finished_at) timings of finished background jobs."""
+    timings = []
+    while True:
+        _, timing = BACKGROUND_CACHE.pull(prefix=JOB_TIMINGS)
+        if timing is None:
+            return timings
+        timings.append(timing)
@@ -0,0 +1,193 @@
+# DR events table benchmark: row-wise vs vectorized filter_dr_events_table pipeline
+#
+# Usage (from the repo root, with the dashboard's dependencies installed):
+#   python -m benchmarks.bench_events_table [--rows 100000] [--days 90]
+#
+# Builds a local SQLite stand-in for the PowerTarget table and times both
+# pipelines for an unfiltered load and a months-wide date filter:
+#   row-wise   - target_period range objects split with df.apply, durations with
+#                an axis=1 apply, then emeraldai's format_table_data
+#   vectorized - range bounds selected as columns in SQL, then format_events_table
+# and then the server-side paged table: one page read by OFFSET vs by keyset
+# (WHERE id < last id of the previous page), near the start and deep into the results.
+# The row-wise pipeline (and the check that both give the same rows) needs the
+# emeraldai package; without it only the vectorized pipeline is timed.
+import argparse
+import os
+import random
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from events_table import format_events_table  # noqa: E402
+
+try:
+    from emeraldai.dashboard.pages.analysis_modules.data_transforms import format_table_data
+except ImportError:
+    format_table_data = None
+
+SCHEMA = '''
+CREATE TABLE power_targets (
+    id INTEGER PRIMARY KEY,
+    description TEXT,
+    subsystem_target REAL NOT NULL,
+    start_time TEXT,
+    end_time TEXT
+);
+CREATE INDEX power_targets_start_time ON power_targets (start_time);
+CREATE INDEX power_targets_end_time ON power_targets (end_time);
+'''
+
+# The stand-in stores the bounds Postgres would extract from target_period with lower()/upper()
+VECTORIZED_QUERY = '''
+SELECT id, description, subsystem_target AS power_target, start_time, end_time
+FROM power_targets
+WHERE (:start IS NULL OR end_time >= :start) AND (:end IS NULL OR start_time <= :end)
+ORDER BY id DESC
+'''
+
+PAGE_OFFSET_QUERY = VECTORIZED_QUERY + 'LIMIT :page_size OFFSET :offset'
+
+PAGE_KEYSET_QUERY = '''
+SELECT id, description, subsystem_target AS power_target, start_time, end_time
+FROM power_targets
+WHERE (:start IS NULL OR end_time >= :start) AND (:end IS NULL OR start_time <= :end) AND id < :after
+ORDER BY id DESC
+LIMIT :page_size
+'''
+
+ROW_QUERY = '''
+SELECT id, description, subsystem_target, start_time, end_time
+FROM power_targets
+WHERE (:start IS NULL OR end_time >= :start) AND (:end IS NULL OR start_time <= :end)
+ORDER BY id DESC
+'''
+
+
+def create_database(path: str, rows: int, seed: int = 0) -> datetime:
+    """Fill a SQLite database with rows of synthetic power targets; returns the newest start."""
+    rng = random.Random(seed)
+    now = datetime(2026, 1, 1, tzinfo=UTC)
+    records = []
+    for event_id in range(1, rows + 1):
+        start = now - timedelta(minutes=15 * (rows - event_id))
+        # A few open-ended events, like targets still being negotiated
+        duration = timedelta(minutes=rng.choice([15, 30, 60, 90, 120, 240]))
+        end = None if rng.random() < 0.01 else start + duration
+        records.append((
+            event_id,
+            f'DR event {event_id}',
+            round(rng.uniform(1e5, 5e6), 1),
+            start.isoformat(),
+            end.isoformat() if end else None,
+        ))
+    with sqlite3.connect(path) as db:
+        db.executescript(SCHEMA)
+        db.executemany('INSERT INTO power_targets VALUES (?, ?, ?, ?, ?)', records)
+    return now
+
+
+def row_wise_pipeline(db, params: dict) -> list:
+    """The previous pipeline: per-row apply on range objects, then format_table_data."""
+    df = pd.read_sql(ROW_QUERY, db, params=params)
+    if df.empty:
+        return []
+    # Stand-in for the driver's Range objects in the target_period column
+    df['target_period'] = [
+        SimpleNamespace(
+            lower=datetime.fromisoformat(start),
+            upper=datetime.fromisoformat(end) if isinstance(end, str) else None,
+        )
+        for start, end in zip(df.pop('start_time'), df.pop('end_time'))
+    ]
+    df['start_time'] = df['target_period'].apply(lambda x: x.lower)
+    df['end_time'] = df['target_period'].apply(lambda x: x.upper)
+    df['duration_mins'] = df.apply(
+        lambda x: (x['end_time'] - x['start_time']).total_seconds() / 60 if x['end_time'] else None,
+        axis=1,
+    )
+    df = df.rename(columns={'subsystem_target': 'power_target'})
+    return format_table_data(df)
+
+
+def vectorized_pipeline(db, params: dict) -> list:
+    """The new pipeline: bounds as columns, column-wise formatting."""
+    return format_events_table(pd.read_sql(VECTORIZED_QUERY, db, params=params))
+
+
+def offset_page(db, params: dict) -> list:
+    """One table page read with OFFSET."""
+    return format_events_table(pd.read_sql(PAGE_OFFSET_QUERY, db, params=params))
+
+
+def keyset_page(db, params: dict) -> list:
+    """One table page read from the previous page's last id."""
+    return format_events_table(pd.read_sql(PAGE_KEYSET_QUERY, db, params=params))
+
+
+def timed(pipeline, db, params: dict, repeat: int) -> tuple:
+    """Median milliseconds over repeat runs, and the last result."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = pipeline(db, params)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the DR events table pipeline.')
+    parser.add_argument('--rows', type=int, default=100_000, help='power target rows in the stand-in table')
+    parser.add_argument('--days', type=int, default=90, help='width of the filtered date range')
+    parser.add_argument('--page-size', type=int, default=10, help='rows per table page')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'power_targets.sqlite')
+        newest = create_database(path, args.rows)
+        scenarios = {
+            'unfiltered': {'start': None, 'end': None},
+            f'last {args.days} days': {'start': (newest - timedelta(days=args.days)).isoformat(), 'end': None},
+        }
+        with sqlite3.connect(path) as db:
+            if format_table_data is None:
+                print('emeraldai is not installed: timing the vectorized pipeline only')
+            for name, params in scenarios.items():
+                vector_ms, vector_result = timed(vectorized_pipeline, db, params, args.repeat)
+                if format_table_data is None:
+                    print(f'{name:>16}: {len(vector_result):>7} rows  vectorized {vector_ms:8.1f} ms')
+                    continue
+                row_ms, row_result = timed(row_wise_pipeline, db, params, args.repeat)
+                if row_result != vector_result:
+                    sys.exit(f'{name}: pipelines disagree')
+                print(
+                    f'{name:>16}: {len(vector_result):>7} rows  row-wise {row_ms:8.1f} ms  '
+                    f'vectorized {vector_ms:8.1f} ms  ({row_ms / vector_ms:.1f}x)'
+                )
+            for page in (1, (args.rows // args.page_size) * 9 // 10):
+                page_params = {'start': None, 'end': None, 'page_size': args.page_size}
+                # Ids are dense and newest-first, so the previous page ends right above this one
+                after = args.rows - page * args.page_size + 1
+                offset_ms, offset_result = timed(
+                    offset_page, db, {**page_params, 'offset': page * args.page_size}, args.repeat,
+                )
+                keyset_ms, keyset_result = timed(keyset_page, db, {**page_params, 'after': after}, args.repeat)
+                if offset_result != keyset_result:
+                    sys.exit(f'page {page}: pagers disagree')
+                print(
+                    f'{"page " + str(page):>16}: {len(keyset_result):>7} rows  offset   {offset_ms:8.1f} ms  '
+                    f'keyset     {keyset_ms:8.1f} ms  ({offset_ms / keyset_ms:.1f}x)'
+                )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,251 @@
+# Page-level navigation benchmark: every href of every persona, in-process
+#
+# Usage (from the repo root):
+#   python -m benchmarks.bench_navigation                          # write benchmarks/baseline.json
+#   python -m benchmarks.bench_navigation --compare benchmarks/baseline.json
+#
+# For each persona and each href in its navigation this measures the page layout
+# build and serialized size, and the server callbacks that fire when navigating
+# there (page router, breadcrumbs, nav menu). Persona switching is measured once
+# per persona. Compare mode exits non-zero when a metric regresses past the threshold.
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+
+from plotly.io.json import to_json_plotly
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import dash  # noqa: E402
+from dash import page_registry  # noqa: E402
+
+import app as dashboard  # noqa: E402
+from navigation import PERSONAS, NAV_INDEX  # noqa: E402
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+
+# Regressions smaller than this are treated as noise
+MIN_REGRESSION_MS = 0.5
+
+UPDATE_URL = dashboard.app.config.routes_pathname_prefix + '_dash-update-component'
+
+
+def output_key(outputs: list) -> str:
+    """Dash's output string for one or more (id, property) outputs."""
+    if len(outputs) == 1:
+        return '{}.{}'.format(*outputs[0])
+    return '..' + '...'.join('{}.{}'.format(*output) for output in outputs) + '..'
+
+
+def callback_body(outputs: list, inputs: list, state: list = (), changed: list = ()) -> dict:
+    """Build a /_dash-update-component request body like the renderer sends."""
+    def prop(entry):
+        if isinstance(entry, list):
+            return [prop(item) for item in entry]
+        component_id, property_name, value = entry
+        return {'id': component_id, 'property': property_name, 'value': value}
+
+    output_specs = [{'id': component_id, 'property': property_name} for component_id, property_name in outputs]
+    return {
+        'output': output_key(outputs),
+        'outputs': output_specs if len(outputs) > 1 else output_specs[0],
+        'inputs': [prop(entry) for entry in inputs],
+        'state': [prop(entry) for entry in state],
+        'changedPropIds': list(changed),
+    }
+
+
+def has_callback(output: str) -> bool:
+    """Whether a server callback is registered for an output (some are clientside per config)."""
+    return output in dashboard.app.callback_map
+
+
+def timed_post(client, body: dict) -> tuple:
+    """POST a callback request and return (milliseconds, response bytes)."""
+    start = time.perf_counter()
+    response = client.post(UPDATE_URL, json=body)
+    elapsed = (time.perf_counter() - start) * 1000
+    if response.status_code not in (200, 204):
+        raise RuntimeError(f'{body["output"]} returned {response.status_code}: {response.get_data(as_text=True)[:200]}')
+    return elapsed, len(response.get_data())
+
+
+def summarize(samples: list) -> dict:
+    """First (cold) and median (warm) of repeated measurements."""
+    return {'first_ms': samples[0], 'median_ms': statistics.median(samples)}
+
+
+def find_page(href: str) -> dict:
+    """Get the registered page for a path."""
+    for page in page_registry.values():
+        if page['path'] == href:
+            return page
+    return None
+
+
+def bench_layout(href: str, repeat: int) -> dict:
+    """Time building and serializing a page's layout."""
+    page = find_page(href)
+    if page is None:
+        return {'missing': True}
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        layout = page['layout']() if callable(page['layout']) else page['layout']
+        payload = to_json_plotly(layout)
+        samples.append((time.perf_counter() - start) * 1000)
+    return {**summarize(samples), 'bytes': len(payload)}
+
+
+def navigation_requests(persona: dict, href: str) -> dict:
+    """The server callback requests fired when navigating to href."""
+    requests = {
+        'router': callback_body(
+            [('_pages_content', 'children'), ('_pages_store', 'data')],
+            [('_pages_location', 'pathname', href), ('_pages_location', 'search', '')],
+            changed=['_pages_location.pathname'],
+        ),
+    }
+    if has_callback('breadcrumbs.children'):
+        requests['breadcrumbs'] = callback_body(
+            [('breadcrumbs', 'children')], [('url', 'pathname', href)], changed=['url.pathname'],
+        )
+    nav_output = output_key([('sidebar-nav-menu', 'children'), ('sidebar-persona-switcher', 'children')])
+    nav_inputs = dashboard.app.callback_map.get(nav_output, {}).get('inputs', [])
+    if any(spec['id'] == 'url' for spec in nav_inputs):
+        requests['nav_menu'] = callback_body(
+            [('sidebar-nav-menu', 'children'), ('sidebar-persona-switcher', 'children')],
+            [('persona-store', 'data', persona), ('url', 'pathname', href)],
+            changed=['url.pathname'],
+        )
+    return requests
+
+
+def persona_switch_requests(persona: dict, previous: dict) -> dict:
+    """The server callback requests fired when switching to a persona."""
+    option_inputs = [
+        ({'type': 'persona-option', 'key': other['key']}, 'n_clicks', 1 if other is persona else None)
+        for other in PERSONAS
+    ]
+    nav_output = output_key([('sidebar-nav-menu', 'children'), ('sidebar-persona-switcher', 'children')])
+    nav_inputs = [('persona-store', 'data', persona)]
+    if any(spec['id'] == 'url' for spec in dashboard.app.callback_map.get(nav_output, {}).get('inputs', [])):
+        nav_inputs.append(('url', 'pathname', NAV_INDEX.ordered_hrefs_for(persona['key'])[0]))
+    return {
+        'switch_persona': callback_body(
+            [('persona-store', 'data')],
+            [option_inputs],
+            state=[('persona-store', 'data', previous)],
+            changed=[json.dumps({'key': persona['key'], 'type': 'persona-option'}, separators=(',', ':')) + '.n_clicks'],
+        ),
+        'persona_render': callback_body(
+            [('sidebar-nav-menu', 'children'), ('sidebar-persona-switcher', 'children')],
+            nav_inputs,
+            changed=['persona-store.data'],
+        ),
+    }
+
+
+def bench_requests(client, requests: dict, repeat: int) -> dict:
+    """Time each callback request repeat times."""
+    results = {}
+    for name, body in requests.items():
+        samples, size = [], 0
+        for _ in range(repeat):
+            elapsed, size = timed_post(client, body)
+            samples.append(elapsed)
+        results[name] = {**summarize(samples), 'bytes': size}
+    return results
+
+
+def run(repeat: int, persona_keys: list = None) -> dict:
+    """Benchmark every persona's navigation and return the results."""
+    client = dashboard.app.server.test_client()
+    # The first request finishes Dash's setup (callbacks are merged into callback_map)
+    client.get(dashboard.app.config.routes_pathname_prefix)
+    personas = [persona for persona in PERSONAS if not persona_keys or persona['key'] in persona_keys]
+    results = {}
+    previous = PERSONAS[-1]
+    for persona in personas:
+        pages = {}
+        for href in NAV_INDEX.ordered_hrefs_for(persona['key']):
+            pages[href] = {
+                'layout': bench_layout(href, repeat),
+                **bench_requests(client, navigation_requests(persona, href), repeat),
+            }
+        results[persona['key']] = {
+            'switch': bench_requests(client, persona_switch_requests(persona, previous), repeat),
+            'pages': pages,
+        }
+        previous = persona
+    return {
+        'meta': {
+            'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': platform.python_version(),
+            'dash': dash.__version__,
+            'repeat': repeat,
+        },
+        'personas': results,
+    }
+
+
+def flatten(results: dict) -> dict:
+    """Flatten results to {'persona href metric.field': value} for comparison."""
+    flat = {}
+    for persona_key, persona in results['personas'].items():
+        for name, metric in persona['switch'].items():
+            for field, value in metric.items():
+                flat[f'{persona_key} [switch] {name}.{field}'] = value
+        for href, page in persona['pages'].items():
+            for name, metric in page.items():
+                for field, value in metric.items():
+                    flat[f'{persona_key} {href} {name}.{field}'] = value
+    return flat
+
+
+def compare(baseline: dict, current: dict, threshold: float) -> list:
+    """List (key, baseline, current) for warm timings and sizes that grew past the threshold."""
+    old, new = flatten(baseline), flatten(current)
+    regressions = []
+    for key, value in new.items():
+        if key not in old or not key.endswith(('.median_ms', '.bytes')):
+            continue
+        before = old[key]
+        noise_floor = MIN_REGRESSION_MS if key.endswith('_ms') else 0
+        if value > before * (1 + threshold) and value - before > noise_floor:
+            regressions.append((key, before, value))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark page navigation for every persona.')
+    parser.add_argument('--repeat', type=int, default=5, help='measurements per page and callback')
+    parser.add_argument('--persona', action='append', help='only benchmark these persona keys')
+    parser.add_argument('--output', default=None, help=f'where to write results (default {DEFAULT_BASELINE})')
+    parser.add_argument('--compare', metavar='BASELINE', help='compare against a baseline instead of replacing it')
+    parser.add_argument('--threshold', type=float, default=0.2, help='allowed relative growth (0.2 = 20%%)')
+    args = parser.parse_args()
+
+    results = run(args.repeat, args.persona)
+    output = args.output or (None if args.compare else DEFAULT_BASELINE)
+    if output:
+        with open(output, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f'Wrote {output}')
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(baseline, results, args.threshold)
+        for key, before, after in regressions:
+            print(f'REGRESSION {key}: {before:.1f} -> {after:.1f}')
+        print(f'{len(regressions)} regression(s) over {args.threshold:.0%}')
+        sys.exit(1 if regressions else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,126 @@
+# Breadcrumb trail resolution from registered page paths
+from dash import dcc, page_registry
+import emerald_ui_components as eui
+
+from navigation import NAV_INDEX
+
+
+def segment_name(segment: str) -> str:
+    """Fallback display name for a path segment without a registered page."""
+    return segment.replace('-', ' ').title()
+
+
+class BreadcrumbTrie:
+    """Path trie mapping each URL segment to its page display name.
+
+    Resolving a trail is O(segments) instead of scanning every registered
+    page for each path prefix.
+    """
+
+    def __init__(self):
+        self.root = {'name': None, 'children': {}}
+        self.size = 0
+
+    def insert(self, path: str, name: str):
+        """Add (or rename) the node for a path."""
+        node = self.root
+        for segment in [s for s in path.split('/') if s]:
+            node = node['children'].setdefault(segment, {'name': None, 'children': {}})
+        if node['name'] is None:
+            self.size += 1
+        node['name'] = name
+
+    def resolve(self, pathname: str) -> list:
+        """Get (path, name) for each segment of a pathname."""
+        trail = []
+        node = self.root
+        path_so_far = ''
+        for segment in [s for s in pathname.split('/') if s]:
+            path_so_far += f'/{segment}'
+            node = node['children'].get(segment) if node else None
+            name = node['name'] if node and node['name'] else segment_name(segment)
+            trail.append((path_so_far, name))
+        return trail
+
+    def to_dict(self, node=None) -> dict:
+        """Compact JSON form ({'n': name, 'c': children}) for the clientside resolver."""
+        node = node or self.root
+        data = {'n': node['name']}
+        if node['children']:
+            data['c'] = {seg: self.to_dict(child) for seg, child in node['children'].items()}
+        return data
+
+    @classmethod
+    def from_registry(cls, registry) -> 'BreadcrumbTrie':
+        """Build from the navigation index, overridden by registered page names."""
+        trie = cls()
+        for path, name in NAV_INDEX.breadcrumb_names.items():
+            trie.insert(path, name)
+        for page in registry.values():
+            trie.insert(page['path'], page['name'])
+        return trie
+
+
+_trie = None
+_trie_key = None
+
+
+@NAV_INDEX.on_rebuild
+def reset_breadcrumb_trie():
+    """Drop the breadcrumb trie so it's rebuilt from the current nav config."""
+    global _trie
+    _trie = None
+
+
+def get_breadcrumb_trie() -> BreadcrumbTrie:
+    """Get the breadcrumb trie, building it once all pages are registered.
+
+    Rebuilds if pages are registered, renamed or moved later.
+    """
+    global _trie, _trie_key
+    key = tuple((page['path'], page['name']) for page in page_registry.values())
+    if _trie is None or _trie_key != key:
+        _trie = BreadcrumbTrie.from_registry(page_registry)
+        _trie_key = key
+    return _trie
+
+
+def create_breadcrumbs(pathname: str):
+    """Create the breadcrumb list for a pathname."""
+    # Handle root path
+    if not pathname or pathname == '/':
+        return eui.BreadcrumbList(children=[
+            eui.BreadcrumbItem(children=[
+                eui.BreadcrumbPage(children='Home'),
+            ]),
+        ])
+
+    trail = get_breadcrumb_trie().resolve(pathname)
+    items = [
+        eui.BreadcrumbItem(className='hidden md:block', children=[
+            eui.BreadcrumbLink(href='/', children='Home'),
+        ]),
+    ]
+
+    for i, (path, name) in enumerate(trail):
+        items.append(eui.BreadcrumbSeparator(className='hidden md:block'))
+
+        # Last segment is current page (not a link)
+        if i == len(trail) - 1:
+            items.append(eui.BreadcrumbItem(children=[
+                eui.BreadcrumbPage(children=name),
+            ]))
+        else:
+            items.append(eui.BreadcrumbItem(className='hidden md:block', children=[
+                eui.BreadcrumbLink(href=path, children=name),
+            ]))
+
+    return eui.BreadcrumbList(children=items)
+
+
+def create_breadcrumb_store():
+    """Create the store that ships the trie to the browser for clientside breadcrumbs."""
+    return dcc.Store(id='breadcrumb-trie', data={
+        'namespace': eui.BreadcrumbList._namespace,
+        'trie': get_breadcrumb_trie().to_dict(),
+    })
@@ -0,0 +1,247 @@
+# Build-time asset pipeline: compile Tailwind, minify, hash and precompress static files
+#
+# Usage: python build_assets.py
+#
+# Compiles only the Tailwind classes used in layout.py, navigation.py, shell.py, components/
+# and pages/ (plus the custom rules in assets/*.css) into app.css, bundles the
+# Lucide icons those files reference into an SVG sprite, minifies the SVG logos,
+# copies the favicon, content-hashes every file name and writes gzip and brotli
+# variants into ASSET_BUILD_DIR with a manifest.json for asset_url().
+import ast
+import gzip
+import hashlib
+import json
+import os
+import re
+import shlex
+import shutil
+import subprocess
+import sys
+import tempfile
+import urllib.request
+
+from components.icon import SPRITE_FILE, icon_id
+from config import ASSET_BUILD_DIR, ICON_SOURCE, TAILWIND_CLI
+from navigation import NAV_INDEX, PERSONA_NAVIGATION
+from static_assets import MANIFEST_FILE
+
+try:
+    import brotli
+except ImportError:  # brotli variants are skipped without it
+    brotli = None
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+ASSETS_DIR = os.path.join(ROOT, 'assets')
+
+# Source files scanned for Tailwind class names
+TAILWIND_SOURCES = ['layout.py', 'navigation.py', 'shell.py', 'components', 'pages']
+
+# Custom CSS merged into the compiled bundle (served separately by Dash otherwise)
+CUSTOM_CSS = ['tailwind.css', 'loading.css']
+
+# Static files copied into the build as-is (SVGs are minified)
+STATIC_FILES = [
+    'favicon.ico',
+    'images/emerald-logo-full.svg',
+    'images/emerald-logo-full-reversed.svg',
+    'images/emerald-logo-widget.svg',
+]
+
+# Calls whose name= argument is an icon name
+ICON_CALLS = {'LucideIcon', 'Icon', 'create_icon'}
+
+# Names eui's LucideIcon still accepts for icons Lucide has since renamed
+ICON_ALIASES = {
+    'line-chart': 'chart-line',
+}
+
+# Only text formats benefit from precompression
+COMPRESSIBLE = ('.css', '.js', '.svg', '.json', '.ico')
+
+
+def find_tailwind_cli() -> list:
+    """Get the Tailwind CLI command: TAILWIND_CLI, a standalone binary, or npx (None if there's none)."""
+    if TAILWIND_CLI:
+        return shlex.split(TAILWIND_CLI)
+    if shutil.which('tailwindcss'):
+        return ['tailwindcss']
+    if shutil.which('npx'):
+        return ['npx', '--yes', '@tailwindcss/cli']
+    return None
+
+
+def compile_tailwind() -> bytes:
+    """Compile the used Tailwind classes and custom CSS into one minified stylesheet.
+
+    Returns None when the Tailwind CLI is missing or fails, so the build still
+    succeeds and the app keeps loading Tailwind from the CDN.
+    """
+    cli = find_tailwind_cli()
+    if cli is None:
+        print('Tailwind CLI not found (install it or set TAILWIND_CLI) - skipping app.css', file=sys.stderr)
+        return None
+    with tempfile.TemporaryDirectory() as tmp:
+        input_css = os.path.join(tmp, 'input.css')
+        output_css = os.path.join(tmp, 'output.css')
+
+        # source(none) disables automatic scanning; only the listed sources count
+        lines = ['@import "tailwindcss" source(none);']
+        lines += [f'@source "{os.path.join(ROOT, source)}";' for source in TAILWIND_SOURCES]
+        for name in CUSTOM_CSS:
+            with open(os.path.join(ASSETS_DIR, name)) as f:
+                lines.append(f.read())
+        with open(input_css, 'w') as f:
+            f.write('\n'.join(lines))
+
+        try:
+            subprocess.run(cli + ['-i', input_css, '-o', output_css, '--minify'], check=True, cwd=ROOT)
+        except (OSError, subprocess.CalledProcessError) as e:
+            print(f'Tailwind CLI failed ({e}) - skipping app.css', file=sys.stderr)
+            return None
+        with open(output_css, 'rb') as f:
+            return f.read()
+
+
+def iter_source_files(sources: list):
+    """Yield the Python files in a list of files and directories."""
+    for source in sources:
+        path = os.path.join(ROOT, source)
+        if os.path.isfile(path):
+            yield path
+            continue
+        for dirpath, _, filenames in os.walk(path):
+            for filename in sorted(filenames):
+                if filename.endswith('.py'):
+                    yield os.path.join(dirpath, filename)
+
+
+def find_icon_names(sources: list = TAILWIND_SOURCES) -> set:
+    """Collect the icon names used by the app.
+
+    Literal names come from LucideIcon/Icon/create_icon calls and 'icon' keys
+    in the sources; names passed as variables come from the navigation config.
+    """
+    names = set()
+    for path in iter_source_files(sources):
+        with open(path) as f:
+            tree = ast.parse(f.read(), filename=path)
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Call):
+                func = node.func
+                func_name = func.attr if isinstance(func, ast.Attribute) else getattr(func, 'id', None)
+                args = [kw.value for kw in node.keywords if kw.arg == 'name']
+                if func_name == 'create_icon':
+                    args += node.args[:1]
+                if func_name in ICON_CALLS:
+                    names.update(arg.value for arg in args if isinstance(arg, ast.Constant))
+            elif isinstance(node, ast.Dict):
+                for key, value in zip(node.keys, node.values):
+                    if isinstance(key, ast.Constant) and key.value == 'icon' and isinstance(value, ast.Constant):
+                        names.add(value.value)
+
+    for nav in PERSONA_NAVIGATION.values():
+        names.update(section['icon'] for section in nav if 'icon' in section)
+    # Stub pages show their section's icon (or a default)
+    names.update(page['icon'] for page in NAV_INDEX.pages.values())
+    return {name for name in names if isinstance(name, str)}
+
+
+def read_icon(sprite_id: str) -> bytes:
+    """Read a Lucide icon's SVG from ICON_SOURCE (a directory or URL template)."""
+    name = ICON_ALIASES.get(sprite_id, sprite_id)
+    if '{name}' in ICON_SOURCE:
+        with urllib.request.urlopen(ICON_SOURCE.format(name=name), timeout=10) as response:
+            return response.read()
+    with open(os.path.join(ICON_SOURCE, f'{name}.svg'), 'rb') as f:
+        return f.read()
+
+
+def build_icon_sprite(names: set) -> bytes:
+    """Stack the icons into one SVG with a <view> per icon, addressable as icons.svg#<id>."""
+    icons = []
+    for sprite_id in sorted({icon_id(name) for name in names}):
+        try:
+            svg = read_icon(sprite_id).decode('utf-8')
+        except OSError as e:
+            # Icons missing from the sprite fall back to the runtime components
+            print(f'icon {sprite_id} not found ({e}) - skipping', file=sys.stderr)
+            continue
+        attrs = re.search(r'<svg([^>]*)>', svg).group(1)
+        view_box = re.search(r'viewBox="([^"]+)"', attrs).group(1)
+        # Keep the presentation attributes (fill, stroke, ...) of the outer <svg>
+        attrs = re.sub(r'\s(xmlns|class|width|height|viewBox)="[^"]*"', '', attrs)
+        attrs = ''.join(f' {attr}' for attr in attrs.split())
+        body = svg[svg.index('>', svg.index('<svg')) + 1:svg.rindex('</svg>')]
+        icons.append((sprite_id, view_box, attrs, body))
+
+    parts = ['<svg xmlns="http://www.w3.org/2000/svg">']
+    y = 0
+    for sprite_id, view_box, attrs, body in icons:
+        _, _, width, height = view_box.split()
+        parts.append(f'<view id="{sprite_id}" viewBox="0 {y} {width} {height}"/>')
+        parts.append(
+            f'<svg y="{y}" width="{width}" height="{height}" viewBox="{view_box}"{attrs}>{body}</svg>'
+        )
+        y += int(float(height))
+    parts.append('</svg>')
+    return minify_svg('\n'.join(parts).encode('utf-8'))
+
+
+def minify_svg(data: bytes) -> bytes:
+    """Strip comments and inter-tag whitespace from an SVG."""
+    text = data.decode('utf-8')
+    text = re.sub(r'<!--.*?-->', '', text, flags=re.S)
+    text = re.sub(r'>\s+<', '><', text)
+    return text.strip().encode('utf-8')
+
+
+def hashed_name(name: str, data: bytes) -> str:
+    """Insert a short content hash before the extension (logo.svg -> logo.1a2b3c4d5e.svg)."""
+    base, ext = os.path.splitext(name)
+    return f'{base}.{hashlib.sha256(data).hexdigest()[:10]}{ext}'
+
+
+def write_asset(build_dir: str, name: str, data: bytes) -> str:
+    """Write a hashed asset plus its precompressed variants; returns the hashed name."""
+    hashed = hashed_name(name, data)
+    path = os.path.join(build_dir, hashed)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(data)
+
+    if name.endswith(COMPRESSIBLE):
+        with open(path + '.gz', 'wb') as f:
+            f.write(gzip.compress(data, compresslevel=9, mtime=0))
+        if brotli is not None:
+            with open(path + '.br', 'wb') as f:
+                f.write(brotli.compress(data, quality=11))
+    return hashed
+
+
+def build(build_dir: str = ASSET_BUILD_DIR) -> dict:
+    """Run the full pipeline into a clean build dir and return the manifest."""
+    shutil.rmtree(build_dir, ignore_errors=True)
+    os.makedirs(build_dir)
+
+    manifest = {}
+    css = compile_tailwind()
+    if css is not None:
+        manifest['app.css'] = write_asset(build_dir, 'app.css', css)
+    manifest[SPRITE_FILE] = write_asset(build_dir, SPRITE_FILE, build_icon_sprite(find_icon_names()))
+    for name in STATIC_FILES:
+        with open(os.path.join(ASSETS_DIR, name), 'rb') as f:
+            data = f.read()
+        if name.endswith('.svg'):
+            data = minify_svg(data)
+        manifest[name] = write_asset(build_dir, name, data)
+
+    with open(os.path.join(build_dir, MANIFEST_FILE), 'w') as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+
+if __name__ == '__main__':
+    if brotli is None:
+        print('brotli not installed - skipping .br variants', file=sys.stderr)
+    for name, hashed in build().items():
+        print(f'{name} -> {hashed}')
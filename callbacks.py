@@ -1,60 +1,85 @@
 # Application callbacks
-from dash import callback, Input, Output, State, page_registry, ctx, no_update
-import emerald_ui_components as eui
+import logging
+import time
 
-from navigation import PERSONAS, DEFAULT_PERSONA
-from components.sidebar import create_nav_menu, create_persona_switcher
+from dash import callback, clientside_callback, Input, Output, State, ALL, Patch, ctx, no_update
+
+from breadcrumbs import create_breadcrumbs
+from config import NAV_CLIENTSIDE_HIGHLIGHT, BREADCRUMBS_CLIENTSIDE
+from metrics import CALLBACK_METRICS
+from navigation import DEFAULT_PERSONA, get_persona
+from components.sidebar import PERSONA_SEARCH, render_nav_menu, create_persona_switcher, create_persona_options
+
+logger = logging.getLogger(__name__)
 
 
 # =============================================================================
 # BREADCRUMB CALLBACK
 # =============================================================================
 
-@callback(
-    Output('breadcrumbs', 'children'),
-    Input('url', 'pathname')
-)
-def update_breadcrumbs(pathname):
-    """Generate breadcrumb trail from URL path segments."""
-    # Handle root path
-    if pathname == '/':
-        return eui.BreadcrumbList(children=[
-            eui.BreadcrumbItem(children=[
-                eui.BreadcrumbPage(children='Home'),
-            ]),
-        ])
-
-    # Build breadcrumb trail from path segments
-    segments = [s for s in pathname.split('/') if s]
-    items = [
-        eui.BreadcrumbItem(className='hidden md:block', children=[
-            eui.BreadcrumbLink(href='/', children='Home'),
-        ]),
-    ]
-
-    path_so_far = ''
-    for i, segment in enumerate(segments):
-        path_so_far += f'/{segment}'
-        items.append(eui.BreadcrumbSeparator(className='hidden md:block'))
-
-        # Look up display name from page registry
-        name = segment.replace('-', ' ').title()
-        for page in page_registry.values():
-            if page['path'] == path_so_far:
-                name = page['name']
-                break
-
-        # Last segment is current page (not a link)
-        if i == len(segments) - 1:
-            items.append(eui.BreadcrumbItem(children=[
-                eui.BreadcrumbPage(children=name),
-            ]))
-        else:
-            items.append(eui.BreadcrumbItem(className='hidden md:block', children=[
-                eui.BreadcrumbLink(href=path_so_far, children=name),
-            ]))
-
-    return eui.BreadcrumbList(children=items)
+if BREADCRUMBS_CLIENTSIDE:
+    # Resolve the trail against the shipped path trie - no server round trip
+    clientside_callback(
+        """
+        function(pathname, trieData) {
+            if (!trieData) {
+                return window.dash_clientside.no_update;
+            }
+            var ns = trieData.namespace;
+            function el(type, props) {
+                return {type: type, namespace: ns, props: props};
+            }
+            function segmentName(segment) {
+                return segment.replace(/-/g, ' ').toLowerCase().replace(/\b\w/g, function(c) {
+                    return c.toUpperCase();
+                });
+            }
+
+            var segments = (pathname || '/').split('/').filter(Boolean);
+            if (!segments.length) {
+                return el('BreadcrumbList', {children: [
+                    el('BreadcrumbItem', {children: [el('BreadcrumbPage', {children: 'Home'})]}),
+                ]});
+            }
+
+            var items = [
+                el('BreadcrumbItem', {className: 'hidden md:block', children: [
+                    el('BreadcrumbLink', {href: '/', children: 'Home'}),
+                ]}),
+            ];
+            var node = trieData.trie;
+            var pathSoFar = '';
+            segments.forEach(function(segment, i) {
+                pathSoFar += '/' + segment;
+                node = node && node.c ? node.c[segment] : null;
+                var name = node && node.n ? node.n : segmentName(segment);
+                items.push(el('BreadcrumbSeparator', {className: 'hidden md:block'}));
+
+                // Last segment is current page (not a link)
+                if (i === segments.length - 1) {
+                    items.push(el('BreadcrumbItem', {children: [el('BreadcrumbPage', {children: name})]}));
+                } else {
+                    items.push(el('BreadcrumbItem', {className: 'hidden md:block', children: [
+                        el('BreadcrumbLink', {href: pathSoFar, children: name}),
+                    ]}));
+                }
+            });
+
+            return el('BreadcrumbList', {children: items});
+        }
+        """,
+        Output('breadcrumbs', 'children'),
+        Input('url', 'pathname'),
+        State('breadcrumb-trie', 'data'),
+    )
+else:
+    @callback(
+        Output('breadcrumbs', 'children'),
+        Input('url', 'pathname')
+    )
+    def update_breadcrumbs(pathname):
+        """Generate breadcrumb trail from URL path segments."""
+        return create_breadcrumbs(pathname)
 
 
 # =============================================================================
@@ -63,15 +88,12 @@ def update_breadcrumbs(pathname):
 
 @callback(
     Output('persona-store', 'data'),
-    [Input(persona['id'], 'n_clicks') for persona in PERSONAS],
+    Input({'type': 'persona-option', 'key': ALL}, 'n_clicks'),
     State('persona-store', 'data'),
     prevent_initial_call=True
 )
-def switch_persona(*args):
+def switch_persona(_n_clicks, current_persona):
     """Handle persona switching when a persona menu item is clicked."""
-    # Last arg is the current persona state
-    current_persona = args[-1]
-
     # Check if this was an actual click (not a component re-render)
     if not ctx.triggered:
         return no_update
@@ -83,38 +105,109 @@ def switch_persona(*args):
     if not triggered_id or not triggered.get('value'):
         return no_update
 
-    # Find the matching persona
-    for persona in PERSONAS:
-        if persona['id'] == triggered_id:
-            # Only update if actually changing to a different persona
-            if current_persona and current_persona.get('id') == persona['id']:
-                return no_update
-            return persona
-
-    return no_update
-
-
-@callback(
-    Output('sidebar-nav-menu', 'children'),
-    Input('persona-store', 'data'),
-    Input('url', 'pathname')
-)
-def update_navigation(persona_data, pathname):
-    """Update the sidebar navigation when persona or URL changes."""
-    if not persona_data:
-        persona_data = DEFAULT_PERSONA
+    persona = get_persona(triggered_id['key'])
+    if persona is None:
+        return no_update
 
-    persona_key = persona_data.get('key', DEFAULT_PERSONA['key'])
-    return [create_nav_menu(persona_key, pathname)]
+    # Only update if actually changing to a different persona
+    if current_persona and current_persona.get('key') == persona['key']:
+        return no_update
+    return persona
+
+
+if PERSONA_SEARCH:
+    @callback(
+        Output('persona-options', 'children'),
+        Output('persona-load-more', 'hidden'),
+        Output('persona-options-shown', 'data'),
+        Input('persona-search', 'value'),
+        Input('persona-load-more', 'n_clicks'),
+        State('persona-options-shown', 'data'),
+        prevent_initial_call=True
+    )
+    def load_persona_options(query, _n_clicks, shown):
+        """Search the persona options, or append the next page of matches on Show more."""
+        if ctx.triggered_id == 'persona-load-more':
+            items, has_more = create_persona_options(query, shown or 0)
+            options = Patch()
+            options.extend(items)
+            return options, not has_more, (shown or 0) + len(items)
+        items, has_more = create_persona_options(query)
+        return items, not has_more, len(items)
 
 
-@callback(
-    Output('sidebar-persona-switcher', 'children'),
-    Input('persona-store', 'data')
-)
-def update_persona_switcher(persona_data):
-    """Update the persona switcher display when persona changes."""
-    if not persona_data:
-        persona_data = DEFAULT_PERSONA
+# =============================================================================
+# PERSONA RENDER CALLBACK
+# =============================================================================
 
-    return [create_persona_switcher(persona_data)]
+def resolve_persona(persona_data):
+    """Get the persona definition for stored persona data, falling back to the default."""
+    return get_persona((persona_data or {}).get('key')) or DEFAULT_PERSONA
+
+
+def render_persona(persona_data, pathname=None, include_switcher=True):
+    """Render the nav menu and persona switcher for a persona in one pass."""
+    start = time.perf_counter()
+
+    persona = resolve_persona(persona_data)
+    nav_menu = [render_nav_menu(persona['key'], pathname)]
+    switcher = [create_persona_switcher(persona)] if include_switcher else no_update
+
+    duration = time.perf_counter() - start
+    # Server-Timing only reaches the browser with dev tools on; the metrics registry always has it
+    ctx.record_timing('persona_render', duration, 'Nav menu and persona switcher')
+    CALLBACK_METRICS.record_timing('persona_render', duration * 1000)
+    logger.debug('Rendered persona %s in %.1fms', persona['key'], duration * 1000)
+    return nav_menu, switcher
+
+
+if NAV_CLIENTSIDE_HIGHLIGHT:
+    @callback(
+        Output('sidebar-nav-menu', 'children'),
+        Output('sidebar-persona-switcher', 'children'),
+        Input('persona-store', 'data')
+    )
+    def update_persona_render(persona_data):
+        """Update the sidebar navigation and persona switcher when persona changes."""
+        return render_persona(persona_data)
+
+    # Flip isActive on the rendered sub-buttons whenever the URL or menu changes
+    clientside_callback(
+        """
+        function(pathname, _menu, persona, navIds) {
+            if (!navIds) {
+                return window.dash_clientside.no_update;
+            }
+            var personas = navIds.personas;
+            var key = persona && personas[persona.key] ? persona.key : navIds['default'];
+            var items = personas[key] || {};
+            var activeId = null;
+
+            Object.keys(items).forEach(function(id) {
+                var isActive = items[id] === pathname;
+                if (isActive && activeId === null) {
+                    activeId = id;
+                }
+                window.dash_clientside.set_props(id, {isActive: isActive});
+            });
+
+            return activeId;
+        }
+        """,
+        Output('sidebar-nav-active', 'data'),
+        Input('url', 'pathname'),
+        Input('sidebar-nav-menu', 'children'),
+        State('persona-store', 'data'),
+        State('sidebar-nav-ids', 'data'),
+    )
+else:
+    @callback(
+        Output('sidebar-nav-menu', 'children'),
+        Output('sidebar-persona-switcher', 'children'),
+        Input('persona-store', 'data'),
+        Input('url', 'pathname')
+    )
+    def update_persona_render(persona_data, pathname):
+        """Update the sidebar navigation when persona or URL changes, and the switcher on persona changes."""
+        # URL-only changes just move the active item; the switcher is unchanged
+        return render_persona(persona_data, pathname, include_switcher=ctx.triggered_id != 'url')
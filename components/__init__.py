@@ -1,11 +1,14 @@
 # Components package
-from .sidebar import create_sidebar, create_nav_menu, create_persona_switcher
+from .sidebar import create_sidebar, create_nav_menu, render_nav_menu, create_persona_switcher
 from .header import create_header, create_user_nav
+from .icon import create_icon
 
 __all__ = [
     'create_sidebar',
     'create_nav_menu',
+    'render_nav_menu',
     'create_persona_switcher',
     'create_header',
     'create_user_nav',
+    'create_icon',
 ]
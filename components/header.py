@@ -2,6 +2,17 @@
 from dash import html
 import emerald_ui_components as eui
 
+from avatars import avatar_url
+from components.icon import create_icon
+
+# Signed-in user shown in the header menu
+CURRENT_USER = {
+    'id': 'andy-neale',
+    'name': 'Andy Neale',
+    'email': 'andy.neale@emeraldai.co',
+    'initials': 'AN',
+}
+
 
 def create_user_nav():
     """Create the user navigation dropdown for the header bar."""
@@ -14,8 +25,8 @@ def create_user_nav():
                     eui.Avatar(
                         className='h-6 w-6',
                         children=[
-                            eui.AvatarImage(src='https://ca.slack-edge.com/T07SVQDLG9Z-U09VCM77CRK-3ece5fd6a4b9-512'),
-                            eui.AvatarFallback(children='AN'),
+                            eui.AvatarImage(src=avatar_url(CURRENT_USER['id'])),
+                            eui.AvatarFallback(children=CURRENT_USER['initials']),
                         ]
                     ),
                 ]
@@ -35,18 +46,18 @@ def create_user_nav():
                                 className='h-6 w-6 rounded-lg',
                                 children=[
                                     eui.AvatarImage(
-                                        src='https://ca.slack-edge.com/T07SVQDLG9Z-U09VCM77CRK-3ece5fd6a4b9-512',
+                                        src=avatar_url(CURRENT_USER['id']),
                                         className='rounded-lg'
                                     ),
                                     eui.AvatarFallback(
                                         className='rounded-lg',
-                                        children='AN'
+                                        children=CURRENT_USER['initials']
                                     ),
                                 ]
                             ),
                             html.Div([
-                                html.Span('Andy Neale', className='truncate font-medium'),
-                                html.Span('andy.neale@emeraldai.co', className='truncate text-xs text-muted-foreground'),
+                                html.Span(CURRENT_USER['name'], className='truncate font-medium'),
+                                html.Span(CURRENT_USER['email'], className='truncate text-xs text-muted-foreground'),
                             ], className='grid flex-1 text-left text-sm leading-tight'),
                         ], className='flex items-center gap-2 px-1 py-1.5 text-left text-sm'),
                     ]
@@ -56,21 +67,21 @@ def create_user_nav():
                     eui.DropdownMenuItem(
                         id='user-account',
                         children=[
-                            eui.LucideIcon(name='BadgeCheck'),
+                            create_icon('BadgeCheck'),
                             html.Span('Account'),
                         ]
                     ),
                     eui.DropdownMenuItem(
                         id='user-billing',
                         children=[
-                            eui.LucideIcon(name='CreditCard'),
+                            create_icon('CreditCard'),
                             html.Span('Billing'),
                         ]
                     ),
                     eui.DropdownMenuItem(
                         id='user-notifications',
                         children=[
-                            eui.LucideIcon(name='Bell'),
+                            create_icon('Bell'),
                             html.Span('Notifications'),
                         ]
                     ),
@@ -79,7 +90,7 @@ def create_user_nav():
                 eui.DropdownMenuItem(
                     id='user-logout',
                     children=[
-                        eui.LucideIcon(name='LogOut'),
+                        create_icon('LogOut'),
                         html.Span('Log out'),
                     ]
                 ),
@@ -0,0 +1,51 @@
+# Icon component backed by the build-time SVG sprite (see build_assets.py)
+import os
+import re
+
+from dash import html
+import emerald_ui_components as eui
+
+from config import ASSET_BUILD_DIR, ICON_SPRITE
+from static_assets import MANIFEST, asset_url
+
+SPRITE_FILE = 'icons.svg'
+
+
+def icon_id(name: str) -> str:
+    """Normalize a Lucide icon name to its sprite id ('Building2' / 'lucide:building-2' -> 'building-2')."""
+    if name.startswith('lucide:'):
+        return name[len('lucide:'):]
+    return re.sub(r'(?<=[a-z0-9])(?=[A-Z])|(?<=[a-zA-Z])(?=[0-9])', '-', name).lower()
+
+
+def load_sprite_icons() -> frozenset:
+    """Get the icon ids in the built sprite, or an empty set if it isn't built."""
+    if SPRITE_FILE not in MANIFEST:
+        return frozenset()
+    try:
+        with open(os.path.join(ASSET_BUILD_DIR, MANIFEST[SPRITE_FILE])) as f:
+            return frozenset(re.findall(r'<view id="([^"]+)"', f.read()))
+    except FileNotFoundError:
+        return frozenset()
+
+
+SPRITE_ICONS = load_sprite_icons() if ICON_SPRITE else frozenset()
+
+
+def create_icon(name: str, className: str = None):
+    """Create an icon from the sprite, falling back to the runtime icon components.
+
+    Accepts LucideIcon names ('Building2') and Iconify names ('lucide:rotate-ccw').
+    """
+    sprite_id = icon_id(name)
+    if sprite_id not in SPRITE_ICONS:
+        component = eui.Icon if name.startswith('lucide:') else eui.LucideIcon
+        if className:
+            return component(name=name, className=className)
+        return component(name=name)
+
+    # The sprite is used as a mask so the icon takes the current text colour
+    return html.Span(
+        className=f'sprite-icon {className}' if className else 'sprite-icon',
+        style={'--icon': f'url({asset_url(SPRITE_FILE)}#{sprite_id})'},
+    )
@@ -2,7 +2,18 @@
 from dash import html, dcc
 import emerald_ui_components as eui
 
-from navigation import PERSONAS, DEFAULT_PERSONA, get_navigation_for_persona
+from components.icon import create_icon
+from config import NAV_MENU_CACHE_SIZE, PERSONA_SWITCHER_LIMIT
+from navigation import PERSONAS, DEFAULT_PERSONA, NAV_INDEX, search_personas
+from render_cache import LRUCache, serialize_component
+from static_assets import asset_url
+
+# Pre-serialized nav menus, keyed by (persona key, active path); dropped when the nav config is rebuilt
+NAV_MENU_CACHE = LRUCache(maxsize=NAV_MENU_CACHE_SIZE)
+NAV_INDEX.on_rebuild(NAV_MENU_CACHE.clear)
+
+# Search and incremental loading only when personas outgrow one page of the switcher
+PERSONA_SEARCH = len(PERSONAS) > PERSONA_SWITCHER_LIMIT
 
 
 def create_sub_item(sub_item, current_path=None):
@@ -34,10 +45,10 @@ def create_nav_item(item, current_path=None):
                     eui.SidebarMenuButton(
                         tooltip=item['title'],
                         children=[
-                            eui.LucideIcon(name=item['icon']),
+                            create_icon(item['icon']),
                             html.Span(item['title']),
-                            eui.LucideIcon(
-                                name='ChevronRight',
+                            create_icon(
+                                'ChevronRight',
                                 className='ml-auto transition-transform duration-200 group-data-[state=open]/collapsible:rotate-90'
                             ),
                         ]
@@ -55,36 +66,76 @@ def create_nav_item(item, current_path=None):
 
 def create_nav_menu(persona_key: str, current_path: str = None):
     """Create the navigation menu for a given persona."""
-    nav_items = get_navigation_for_persona(persona_key)
+    nav_items = NAV_INDEX.navigation(persona_key)
     return eui.SidebarMenu(children=[
         create_nav_item(item, current_path) for item in nav_items
     ])
 
 
+def render_nav_menu(persona_key: str, current_path: str = None):
+    """Get the pre-serialized navigation menu for a persona, using the render cache."""
+    # Paths outside this persona's nav render identically, so share one entry
+    if current_path not in NAV_INDEX.hrefs_for(persona_key):
+        current_path = None
+    key = (persona_key, current_path)
+    return NAV_MENU_CACHE.get_or_create(
+        key, lambda: serialize_component(create_nav_menu(persona_key, current_path))
+    )
+
+
+def create_persona_item(persona):
+    """Create a persona dropdown item with a pattern-matching id."""
+    return eui.DropdownMenuItem(
+        id={'type': 'persona-option', 'key': persona['key']},
+        className='gap-2 p-2',
+        children=[
+            html.Div([
+                html.Div(className=f'size-2 rounded-full {persona["color"]}'),
+            ], className='flex size-6 items-center justify-center rounded-md border'),
+            html.Div([
+                html.Span(persona['name'], className='font-medium'),
+                html.Span(persona['description'], className='text-xs text-muted-foreground'),
+            ], className='grid flex-1 text-left leading-tight'),
+            eui.DropdownMenuShortcut(children=persona.get('shortcut', '')),
+        ]
+    )
+
+
+def create_persona_options(query: str = None, offset: int = 0) -> tuple:
+    """Create one page (PERSONA_SWITCHER_LIMIT) of persona items matching a search query.
+
+    Returns the items and whether more matches follow.
+    """
+    personas, total = search_personas(query, offset, PERSONA_SWITCHER_LIMIT)
+    return [create_persona_item(persona) for persona in personas], offset + len(personas) < total
+
+
 def create_persona_switcher(current_persona=None):
     """Create the persona switcher dropdown in sidebar footer."""
     if current_persona is None:
         current_persona = DEFAULT_PERSONA
 
-    # Build menu items for each persona
-    persona_items = []
-    for persona in PERSONAS:
-        persona_items.append(
-            eui.DropdownMenuItem(
-                id=persona['id'],
-                className='gap-2 p-2',
-                children=[
-                    html.Div([
-                        html.Div(className=f'size-2 rounded-full {persona["color"]}'),
-                    ], className='flex size-6 items-center justify-center rounded-md border'),
-                    html.Div([
-                        html.Span(persona['name'], className='font-medium'),
-                        html.Span(persona['description'], className='text-xs text-muted-foreground'),
-                    ], className='grid flex-1 text-left leading-tight'),
-                    eui.DropdownMenuShortcut(children=persona['shortcut']),
-                ]
-            )
-        )
+    # Only one page of personas is rendered; with more than that, add a search box and Show more
+    options, has_more = create_persona_options()
+    persona_items = [html.Div(id='persona-options', children=options)]
+    if PERSONA_SEARCH:
+        persona_items = [
+            dcc.Input(
+                id='persona-search',
+                type='search',
+                placeholder='Search personas...',
+                debounce=0.3,
+                className='mx-1 mb-1 h-8 w-[calc(100%-0.5rem)] rounded-md border bg-transparent px-2 text-sm',
+            ),
+            *persona_items,
+            html.Button(
+                'Show more',
+                id='persona-load-more',
+                hidden=not has_more,
+                className='w-full rounded-sm px-2 py-1.5 text-left text-sm text-muted-foreground hover:bg-accent',
+            ),
+            dcc.Store(id='persona-options-shown', data=len(options)),
+        ]
 
     return eui.SidebarMenu(children=[
         eui.SidebarMenuItem(children=[
@@ -101,7 +152,7 @@ def create_persona_switcher(current_persona=None):
                                 html.Span(current_persona['name'], className='truncate font-medium'),
                                 html.Span(current_persona['description'], className='truncate text-xs text-muted-foreground'),
                             ], className='grid flex-1 text-left text-sm leading-tight'),
-                            eui.LucideIcon(name='ChevronsUpDown', className='ml-auto'),
+                            create_icon('ChevronsUpDown', className='ml-auto'),
                         ]
                     ),
                 ]),
@@ -135,18 +186,18 @@ def create_sidebar():
                 html.Div([
                     # Light mode logo (dark text) - visible in light theme only
                     html.Img(
-                        src='/assets/images/emerald-logo-full.svg',
+                        src=asset_url('images/emerald-logo-full.svg'),
                         className='h-8 logo-light'
                     ),
                     # Dark mode logo (white text) - visible in dark theme only
                     html.Img(
-                        src='/assets/images/emerald-logo-full-reversed.svg',
+                        src=asset_url('images/emerald-logo-full-reversed.svg'),
                         className='h-8 logo-dark'
                     ),
                 ], className='flex items-center justify-center group-data-[collapsible=icon]:hidden bg-card -m-2 h-16 border-b'),
                 # Widget logo - only shown when collapsed (same for both modes)
                 html.Div([
-                    html.Img(src='/assets/images/emerald-logo-widget.svg', className='size-8'),
+                    html.Img(src=asset_url('images/emerald-logo-widget.svg'), className='size-8'),
                 ], className='hidden items-center group-data-[collapsible=icon]:flex'),
             ]),
 
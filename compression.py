@@ -0,0 +1,30 @@
+# Negotiated response compression (brotli/gzip) for the Flask server behind Dash
+from flask_compress import Compress
+
+from config import COMPRESS_LEVEL, COMPRESS_BR_LEVEL, COMPRESS_MIN_SIZE
+
+# Dash layout, dependencies and callback payloads are JSON; the index page is HTML
+COMPRESS_MIMETYPES = [
+    'application/json',
+    'text/html',
+    'text/css',
+    'text/javascript',
+    'application/javascript',
+    'image/svg+xml',
+]
+
+
+def init_compression(server):
+    """Compress responses with the best encoding the client accepts.
+
+    Responses that already carry a Content-Encoding (the precompressed files
+    under /dist/) or are smaller than COMPRESS_MIN_SIZE are left alone.
+    """
+    server.config.update(
+        COMPRESS_ALGORITHM=['br', 'gzip'],
+        COMPRESS_MIMETYPES=COMPRESS_MIMETYPES,
+        COMPRESS_LEVEL=COMPRESS_LEVEL,
+        COMPRESS_BR_LEVEL=COMPRESS_BR_LEVEL,
+        COMPRESS_MIN_SIZE=COMPRESS_MIN_SIZE,
+    )
+    Compress(server)
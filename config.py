@@ -1,14 +1,127 @@
 # Application configuration
 import os
 
-# Set to False for production (uses pre-built CSS only)
-DEBUG = os.environ.get('DEBUG', 'true').lower() == 'true'
+# Set DEBUG=true for local development (Tailwind CDN + Dash dev server debug mode)
+# Production uses the CSS compiled by build_assets.py
+DEBUG = os.environ.get('DEBUG', 'false').lower() == 'true'
 
-# In dev mode, add Tailwind CDN for instant class updates without rebuilding
-# In production, only the pre-built CSS from emerald_ui_components is used
-EXTERNAL_SCRIPTS = (
-    ["https://cdn.jsdelivr.net/npm/@tailwindcss/browser@4"] if DEBUG else []
-)
+# Tailwind browser build, loaded in dev mode (instant class updates without rebuilding)
+# and whenever build_assets.py hasn't been run; otherwise the compiled app.css is used
+TAILWIND_CDN = "https://cdn.jsdelivr.net/npm/@tailwindcss/browser@4"
 
 # Server settings - Railway provides PORT env var
 PORT = int(os.environ.get('PORT', 8052))
+
+# Max rendered sidebar menus kept per worker, keyed by (persona, active path)
+NAV_MENU_CACHE_SIZE = int(os.environ.get('NAV_MENU_CACHE_SIZE', 256))
+
+# Render the sidebar once per persona and highlight the active item in the browser,
+# so plain page navigation doesn't round-trip to the server
+NAV_CLIENTSIDE_HIGHLIGHT = os.environ.get('NAV_CLIENTSIDE_HIGHLIGHT', 'false').lower() == 'true'
+
+# Ship the breadcrumb path trie to the browser and build breadcrumbs clientside
+BREADCRUMBS_CLIENTSIDE = os.environ.get('BREADCRUMBS_CLIENTSIDE', 'false').lower() == 'true'
+
+# Max personas rendered in the switcher dropdown; beyond this a search box filters them
+PERSONA_SWITCHER_LIMIT = int(os.environ.get('PERSONA_SWITCHER_LIMIT', 8))
+
+# Import simple page modules on first visit instead of at startup (faster cold start)
+LAZY_PAGES = os.environ.get('LAZY_PAGES', 'false').lower() == 'true'
+
+# Print per-module import and page registration times at startup
+STARTUP_PROFILE = os.environ.get('STARTUP_PROFILE', 'false').lower() == 'true'
+
+# Production server (gunicorn) settings - see gunicorn.conf.py
+WEB_WORKERS = int(os.environ.get('WEB_CONCURRENCY', 2))
+WEB_THREADS = int(os.environ.get('WEB_THREADS', 4))
+WEB_PRELOAD = os.environ.get('WEB_PRELOAD', 'true').lower() == 'true'
+WEB_TIMEOUT = int(os.environ.get('WEB_TIMEOUT', 60))
+WEB_GRACEFUL_TIMEOUT = int(os.environ.get('WEB_GRACEFUL_TIMEOUT', 30))
+WEB_KEEPALIVE = int(os.environ.get('WEB_KEEPALIVE', 5))
+WEB_MAX_REQUESTS = int(os.environ.get('WEB_MAX_REQUESTS', 1000))
+WEB_MAX_REQUESTS_JITTER = int(os.environ.get('WEB_MAX_REQUESTS_JITTER', 100))
+
+# Build-time asset pipeline (build_assets.py) output directory and URL prefix
+ASSET_BUILD_DIR = os.environ.get('ASSET_BUILD_DIR', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'dist'))
+ASSET_URL_PREFIX = '/dist'
+
+# Tailwind CLI command used by build_assets.py (defaults to a tailwindcss binary or npx)
+TAILWIND_CLI = os.environ.get('TAILWIND_CLI')
+
+# Response compression - gzip level (1-9), brotli quality (0-11) and minimum body size in bytes
+RESPONSE_COMPRESSION = os.environ.get('RESPONSE_COMPRESSION', 'true').lower() == 'true'
+COMPRESS_LEVEL = int(os.environ.get('COMPRESS_LEVEL', 6))
+COMPRESS_BR_LEVEL = int(os.environ.get('COMPRESS_BR_LEVEL', 4))
+COMPRESS_MIN_SIZE = int(os.environ.get('COMPRESS_MIN_SIZE', 500))
+
+# Cache serialized /_dash-layout and /_dash-dependencies responses with ETags
+LAYOUT_CACHE = os.environ.get('LAYOUT_CACHE', 'true').lower() == 'true'
+
+# Avatar proxy - source image (http(s) URL, file:// URL or local path) and resized-image cache dir
+USER_AVATAR_SOURCE = os.environ.get(
+    'USER_AVATAR_SOURCE', 'https://ca.slack-edge.com/T07SVQDLG9Z-U09VCM77CRK-3ece5fd6a4b9-512'
+)
+AVATAR_CACHE_DIR = os.environ.get(
+    'AVATAR_CACHE_DIR', os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache', 'avatars')
+)
+
+# Pre-render a static sidebar/header shell into the index page (replaces the full-screen loader)
+SSR_SHELL = os.environ.get('SSR_SHELL', 'false').lower() == 'true'
+
+# Render icons from the built SVG sprite instead of resolving them at runtime
+ICON_SPRITE = os.environ.get('ICON_SPRITE', 'true').lower() == 'true'
+# Where build_assets.py reads Lucide SVGs: a directory or a URL template with {name}
+ICON_SOURCE = os.environ.get('ICON_SOURCE', 'https://unpkg.com/lucide-static@0.469.0/icons/{name}.svg')
+
+# Record per-callback latency, payload size and error metrics for /dev/metrics
+CALLBACK_METRICS = os.environ.get('CALLBACK_METRICS', 'true').lower() == 'true'
+
+# Seconds a health dependency check (e.g. the database probe) result is reused
+HEALTH_CHECK_INTERVAL = float(os.environ.get('HEALTH_CHECK_INTERVAL', '10'))
+
+# Opt-in sampling profiler for callbacks (profiles are viewed on /dev/metrics)
+CALLBACK_PROFILER = os.environ.get('CALLBACK_PROFILER', 'false').lower() == 'true'
+# Callback function names that are always profiled (comma-separated)
+PROFILE_CALLBACKS = {name.strip() for name in os.environ.get('PROFILE_CALLBACKS', '').split(',') if name.strip()}
+# Fraction of all other callback requests profiled at random (0-1)
+PROFILE_SAMPLE_RATE = float(os.environ.get('PROFILE_SAMPLE_RATE', '0'))
+# Requests carrying this header are profiled (opt-in, e.g. 'X-Profile-Callback'; '' disables)
+PROFILE_HEADER = os.environ.get('PROFILE_HEADER', '')
+# Stack sampling interval, where profiles are stored and how many are kept
+PROFILE_INTERVAL_MS = float(os.environ.get('PROFILE_INTERVAL_MS', '5'))
+PROFILE_DIR = os.environ.get(
+    'PROFILE_DIR', os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache', 'profiles')
+)
+PROFILE_STORE_SIZE = int(os.environ.get('PROFILE_STORE_SIZE', '50'))
+
+# Pooled read-only database engine (db_pool.py) - unset URL disables it
+READONLY_DATABASE_URL = os.environ.get('READONLY_DATABASE_URL') or os.environ.get('DATABASE_URL')
+DB_POOL_SIZE = int(os.environ.get('DB_POOL_SIZE', '5'))
+DB_MAX_OVERFLOW = int(os.environ.get('DB_MAX_OVERFLOW', '5'))
+DB_POOL_TIMEOUT = float(os.environ.get('DB_POOL_TIMEOUT', '10'))
+DB_POOL_RECYCLE = int(os.environ.get('DB_POOL_RECYCLE', '1800'))
+DB_POOL_PRE_PING = os.environ.get('DB_POOL_PRE_PING', 'true').lower() == 'true'
+# Connections opened when each worker starts
+DB_POOL_WARMUP = int(os.environ.get('DB_POOL_WARMUP', DB_POOL_SIZE))
+
+# Query-result cache shared by all workers (SQLite file) - TTL in seconds and max entries
+QUERY_CACHE = os.environ.get('QUERY_CACHE', 'true').lower() == 'true'
+QUERY_CACHE_PATH = os.environ.get(
+    'QUERY_CACHE_PATH', os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache', 'query_cache.sqlite')
+)
+QUERY_CACHE_TTL = float(os.environ.get('QUERY_CACHE_TTL', '300'))
+QUERY_CACHE_SIZE = int(os.environ.get('QUERY_CACHE_SIZE', '10000'))
+
+# Stop DR events table queries superseded by a newer request from the same tab (SQLite file shared by workers)
+CANCEL_SUPERSEDED = os.environ.get('CANCEL_SUPERSEDED', 'true').lower() == 'true'
+SUPERSEDE_PATH = os.environ.get(
+    'SUPERSEDE_PATH', os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache', 'latest_requests.sqlite')
+)
+# How often a running query checks whether it has been superseded
+SUPERSEDE_POLL_MS = float(os.environ.get('SUPERSEDE_POLL_MS', '100'))
+
+# Background callbacks (e.g. the DR event analysis) - disk cache shared by workers and seconds results are kept
+BACKGROUND_CACHE_DIR = os.environ.get(
+    'BACKGROUND_CACHE_DIR', os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache', 'background')
+)
+BACKGROUND_RESULT_EXPIRE = int(os.environ.get('BACKGROUND_RESULT_EXPIRE', '600'))
@@ -0,0 +1,161 @@
+# Process-wide pooled read-only database engine with warmup and pool gauges
+import os
+import threading
+import time
+from collections import deque
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import QueuePool
+
+from config import (
+    READONLY_DATABASE_URL,
+    DB_POOL_SIZE,
+    DB_MAX_OVERFLOW,
+    DB_POOL_TIMEOUT,
+    DB_POOL_RECYCLE,
+    DB_POOL_PRE_PING,
+    DB_POOL_WARMUP,
+)
+
+# Recent checkout waits kept for the wait percentiles
+RECENT_WAITS = 1000
+
+
+class MeteredQueuePool(QueuePool):
+    """QueuePool that records how long each checkout waited (including pre-ping and connect)."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.checkouts = 0
+        self.checkout_errors = 0
+        self.total_wait_ms = 0.0
+        self.max_wait_ms = 0.0
+        self.recent_waits = deque(maxlen=RECENT_WAITS)
+        self._stats_lock = threading.Lock()
+
+    def connect(self):
+        """Check out a connection, recording the wait."""
+        start = time.perf_counter()
+        try:
+            return super().connect()
+        except Exception:
+            with self._stats_lock:
+                self.checkout_errors += 1
+            raise
+        finally:
+            wait_ms = (time.perf_counter() - start) * 1000
+            with self._stats_lock:
+                self.checkouts += 1
+                self.total_wait_ms += wait_ms
+                self.max_wait_ms = max(self.max_wait_ms, wait_ms)
+                self.recent_waits.append(wait_ms)
+
+    def gauges(self) -> dict:
+        """Pool occupancy and checkout-wait stats."""
+        with self._stats_lock:
+            waits = sorted(self.recent_waits)
+            checkouts, checkout_errors = self.checkouts, self.checkout_errors
+            total_wait_ms, max_wait_ms = self.total_wait_ms, self.max_wait_ms
+        return {
+            'size': self.size(),
+            'max_overflow': self._max_overflow,
+            'in_use': self.checkedout(),
+            'idle': self.checkedin(),
+            'overflow': max(self.overflow(), 0),
+            'checkouts': checkouts,
+            'checkout_errors': checkout_errors,
+            'mean_wait_ms': total_wait_ms / checkouts if checkouts else 0.0,
+            'p95_wait_ms': waits[int(len(waits) * 0.95)] if waits else 0.0,
+            'max_wait_ms': max_wait_ms,
+        }
+
+
+_lock = threading.Lock()
+_engine = None
+_engine_pid = None
+_session_factory = None
+
+
+def is_configured() -> bool:
+    """Whether a read-only database URL is set."""
+    return bool(READONLY_DATABASE_URL)
+
+
+def get_engine():
+    """Get this process's pooled engine, creating it on first use (and again after fork)."""
+    global _engine, _engine_pid, _session_factory
+    if _engine is not None and _engine_pid == os.getpid():
+        return _engine
+    if not is_configured():
+        raise RuntimeError('READONLY_DATABASE_URL is not set')
+
+    with _lock:
+        if _engine is not None and _engine_pid != os.getpid():
+            # Inherited from the parent: drop its connections without closing the parent's sockets
+            _engine.dispose(close=False)
+            _engine = None
+        if _engine is None:
+            _engine = create_engine(
+                READONLY_DATABASE_URL,
+                poolclass=MeteredQueuePool,
+                pool_size=DB_POOL_SIZE,
+                max_overflow=DB_MAX_OVERFLOW,
+                pool_timeout=DB_POOL_TIMEOUT,
+                pool_recycle=DB_POOL_RECYCLE,
+                pool_pre_ping=DB_POOL_PRE_PING,
+            )
+            _engine_pid = os.getpid()
+            _session_factory = sessionmaker(bind=_engine, autoflush=False, expire_on_commit=False)
+    return _engine
+
+
+def readonly_session_factory() -> sessionmaker:
+    """Get the sessionmaker bound to the pooled engine (same interface as emeraldai.db.connection).
+
+    Without a database URL of our own, emeraldai's session factory is used.
+    """
+    if not is_configured():
+        from emeraldai.db.connection import readonly_session_factory as emeraldai_session_factory
+        return emeraldai_session_factory()
+    get_engine()
+    return _session_factory
+
+
+def use_pooled_sessions(*modules):
+    """Make emeraldai code that opens its own sessions (e.g. the data_transforms helpers) use the pool.
+
+    Replaces emeraldai.db.connection.readonly_session_factory and the copies
+    bound by 'from ... import readonly_session_factory' in the given modules.
+    Does nothing without a database URL, so emeraldai's own sessions are used.
+    """
+    if not is_configured():
+        return
+    from emeraldai.db import connection
+    for module in (connection, *modules):
+        if hasattr(module, 'readonly_session_factory'):
+            module.readonly_session_factory = readonly_session_factory
+
+
+def warm_pool(connections: int = DB_POOL_WARMUP):
+    """Open connections up front so the first requests don't pay for connection setup."""
+    if not is_configured() or connections <= 0:
+        return
+    engine = get_engine()
+    opened = []
+    try:
+        for _ in range(min(connections, DB_POOL_SIZE)):
+            connection = engine.connect()
+            connection.execute(text('SELECT 1'))
+            opened.append(connection)
+    finally:
+        # Returned connections stay open in the pool
+        for connection in opened:
+            connection.close()
+
+
+def pool_gauges() -> dict:
+    """Pool gauges for the metrics surface ({'configured': False} without a database URL)."""
+    if not is_configured():
+        return {'configured': False}
+    return {'configured': True, **get_engine().pool.gauges()}
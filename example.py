@@ -1,25 +1,35 @@
 # emeraldai/dashboard/pages/analysis_modules/events_table.py
 # pyright: standard
 
+import json
 import logging
+import math
+import operator
+import re
+import uuid
+from contextlib import nullcontext
 from dash.exceptions import PreventUpdate
-from datetime import UTC, datetime, timedelta
+from datetime import UTC, date, datetime, timedelta
 
 import dash
 import dash_bootstrap_components as dbc
 import pandas as pd
 from dash import Input, Output, State, callback, dcc, html
-from sqlalchemy import Select
+from sqlalchemy import ColumnElement, Select, and_, func, or_, select
 
+from emeraldai.dashboard.pages.analysis_modules import data_transforms
 from emeraldai.dashboard.pages.analysis_modules.chart_utils import COLOR_PALETTE
 from emeraldai.dashboard.pages.analysis_modules.data_transforms import (
     EventTableDataEntry,
-    format_table_data,
     job_ids_in_time_window,
     power_targets_in_time_window,
 )
 from emeraldai.dashboard.pages.analysis_modules.store import AnalysisWindowData
-from emeraldai.db.connection import readonly_session_factory
+from background import BACKGROUND_MANAGER, instrument_job
+from events_table import format_events_table
+from db_pool import readonly_session_factory, use_pooled_sessions
+from query_cache import QUERY_CACHE
+from supersede import LATEST_REQUESTS, SupersededError
 from emeraldai.db.models import PowerTarget
 from emeraldai.dashboard.styles import get_interval_options_for_role
 
@@ -28,9 +38,29 @@ from emeraldai.dashboard.auth import is_admin
 # When the user selects an event, how much extra time to include around it
 EVENT_SELECTION_BUFFER = timedelta(minutes=10)
 
+# Rows per page of the DR events table
+EVENTS_PAGE_SIZE = 10
+
+# Query cache namespace for DR events table counts and pages. This page only
+# reads PowerTargets, so cached results refresh by TTL unless the writer calls
+# query_cache.invalidate_on_commit(PowerTarget, "dr_events")
+DR_EVENTS_CACHE = "dr_events"
+
+# Pause in typing (ms) before a numeric filter input updates the table
+FILTER_DEBOUNCE_MS = 400
+
+# How long (ms) a newly picked start date waits for its end date before the table updates
+DATE_FILTER_DEBOUNCE_MS = 1500
+
+# How often (ms) the browser polls the background analysis for progress
+ANALYSIS_POLL_MS = 500
+
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
+# job_ids_in_time_window and power_targets_in_time_window open their own sessions
+use_pooled_sessions(data_transforms)
+
 
 def user_datetime_str(dt: datetime) -> str:
     """Formats a datetime object into a user-friendly but ISO-parseable string."""
@@ -55,26 +85,19 @@ def update_signal_table(_pathname: str, is_dark: bool) -> dbc.Alert | html.Div:
             {"name": "Time", "id": "time", "type": "text"},
             {"name": "Duration", "id": "duration", "type": "text"},
             {"name": "Power Target (W)", "id": "power_target", "type": "text"},
-            # Include raw columns for sorting/filtering but don't display them
-            {"name": "_start_ts", "id": "_start_ts", "type": "numeric"},
-            {"name": "_end_ts", "id": "_end_ts", "type": "numeric"},
         ],
-        # Hide the columns with raw values using the style_cell_conditional property
-        style_cell_conditional=[
-            {
-                "if": {"column_id": col},
-                "display": "none",
-            }
-            for col in [
-                "_start_ts",
-                "_end_ts",
-            ]
-        ],  # type: ignore
-        sort_action="native",
+        # Paging, sorting and filtering run in SQL; only the visible page is sent
+        page_action="custom",
+        page_current=0,
+        page_count=1,
+        sort_action="custom",
         sort_mode="single",
-        filter_action="none",
+        sort_by=[],
+        filter_action="custom",
+        filter_query="",
         row_selectable="multi",  # Changed from "single" to "multi"
-        selected_rows=[],
+        # Row ids (the power target id) keep selections across pages
+        selected_row_ids=[],
         style_table={"overflowX": "auto"},
         style_cell={
             "textAlign": "left",
@@ -88,7 +111,7 @@ def update_signal_table(_pathname: str, is_dark: bool) -> dbc.Alert | html.Div:
             "textAlign": "left",
             "padding": "12px 8px",
         },
-        page_size=10,
+        page_size=EVENTS_PAGE_SIZE,
     )
 
     timeline_container = html.Div(
@@ -123,7 +146,8 @@ def update_signal_table(_pathname: str, is_dark: bool) -> dbc.Alert | html.Div:
                                         min=0,
                                         placeholder="Min duration",
                                         className="mb-2",
-                                        debounce=True,
+                                        # Fire once typing pauses, not per keystroke
+                                        debounce=FILTER_DEBOUNCE_MS,
                                     ),
                                 ],
                                 width=4,
@@ -137,7 +161,8 @@ def update_signal_table(_pathname: str, is_dark: bool) -> dbc.Alert | html.Div:
                                         min=0,
                                         placeholder="power target",
                                         className="mb-2",
-                                        debounce=True,
+                                        # Fire once typing pauses, not per keystroke
+                                        debounce=FILTER_DEBOUNCE_MS,
                                     ),
                                 ],
                                 width=4,
@@ -171,6 +196,12 @@ def update_signal_table(_pathname: str, is_dark: bool) -> dbc.Alert | html.Div:
                 "Select the events you wish to include. You only need to select the earliest and latest. You can also edit the times below."
             ),
             data_table,
+            # The date filter's {start, end}, debounced while a range is being picked
+            dcc.Store(id="dr-date-range", data=None),
+            # Page-boundary ids for keyset pagination of the current filter and sort
+            dcc.Store(id="dr-events-cursors", data=None),
+            # Identifies this tab so a newer table request can supersede an older one
+            dcc.Store(id="dr-events-tab", data=uuid.uuid4().hex),
             dbc.Card(
                 dbc.CardBody(
                     dbc.Row(
@@ -246,6 +277,37 @@ def update_signal_table(_pathname: str, is_dark: bool) -> dbc.Alert | html.Div:
                                                 value=None,
                                                 className="w-100",
                                             ),
+                                            # Shown while plot_selected_events runs in the background
+                                            html.Div(
+                                                [
+                                                    dbc.Progress(
+                                                        id="analysis-progress-bar",
+                                                        value=0,
+                                                        striped=True,
+                                                        animated=True,
+                                                        className="mb-1",
+                                                    ),
+                                                    html.Div(
+                                                        [
+                                                            html.Small(
+                                                                id="analysis-progress-label",
+                                                                className="text-muted",
+                                                            ),
+                                                            dbc.Button(
+                                                                "Cancel",
+                                                                id="cancel-analysis-button",
+                                                                color="link",
+                                                                size="sm",
+                                                                className="p-0",
+                                                            ),
+                                                        ],
+                                                        className="d-flex justify-content-between",
+                                                    ),
+                                                ],
+                                                id="analysis-progress",
+                                                className="mt-2",
+                                                style={"display": "none"},
+                                            ),
                                         ]
                                     ),
                                     className="h-100",
@@ -266,29 +328,26 @@ def update_signal_table(_pathname: str, is_dark: bool) -> dbc.Alert | html.Div:
 @callback(
     Output("analysis-start-input", "value", allow_duplicate=True),
     Output("analysis-end-input", "value", allow_duplicate=True),
-    Input("dr-events-table", "selected_rows"),
-    State("dr-events-table", "data"),
+    Input("dr-events-table", "selected_row_ids"),
     prevent_initial_call=True,
 )
-def events_selected(
-    selected_rows: list[int], table_data: list[EventTableDataEntry]
-) -> tuple[str, str]:
-    """Store the selected DR event IDs for later use."""
-    if not selected_rows or not table_data:
-        raise PreventUpdate
+def events_selected(selected_row_ids: list[int] | None) -> tuple[str, str]:
+    """Sets the analysis window to span the selected DR events.
 
-    start = end = None
+    Selections can span pages, so the bounds come from the database rather
+    than the rows currently in the table.
+    """
+    if not selected_row_ids:
+        raise PreventUpdate
 
-    for row_idx in selected_rows:
-        row = table_data[row_idx]
-        row_start = datetime.fromtimestamp(row["_start_ts"], UTC)
-        row_end = datetime.fromtimestamp(row["_end_ts"], UTC)
-        if start is None or end is None:
-            start = row_start
-            end = row_end
-        else:
-            start = min(start, row_start)
-            end = max(end, row_end)
+    db_session = readonly_session_factory()
+    with db_session() as db:
+        start, end = db.execute(
+            select(
+                func.min(PowerTarget.sql_start_time()),
+                func.max(PowerTarget.sql_end_time()),
+            ).where(PowerTarget.id.in_(selected_row_ids))
+        ).one()
 
     if start is None or end is None:
         raise PreventUpdate
@@ -301,11 +360,11 @@ def events_selected(
 
 @callback(
     Output("copy-link-button", "style"),
-    Input("dr-events-table", "selected_rows"),
+    Input("dr-events-table", "selected_row_ids"),
 )
-def toggle_copy_link_button(selected_rows: list[int] | None) -> dict:
+def toggle_copy_link_button(selected_row_ids: list[int] | None) -> dict:
     """Show Copy Link button only when 2+ events are selected to define a range."""
-    if selected_rows and len(selected_rows) >= 2:
+    if selected_row_ids and len(selected_row_ids) >= 2:
         return {"display": "inline-block"}  # Show button
     return {"display": "none"}  # Hide button
 
@@ -379,52 +438,397 @@ def update_analysis_window(
 )
 def reset_filters(
     _n_clicks: int,
-) -> tuple[datetime | None, datetime | None, None, None]:
+) -> tuple[date | None, date | None, None, None]:
     """Resets all filter inputs to their default state."""
-    return datetime.now(UTC) - timedelta(days=7), None, None, None
+    # A date rather than a timestamp, so the default window is cached all day
+    return (datetime.now(UTC) - timedelta(days=7)).date(), None, None, None
 
 
-@callback(
-    Output("dr-events-table", "data"),
+# Debounce the date pair: picking a range changes start_date and then end_date,
+# so a start-only change waits for the end date (or DATE_FILTER_DEBOUNCE_MS)
+# before the table queries. End date changes, clearing, resets and the first
+# value apply at once.
+dash.clientside_callback(
+    """
+    function(start, end, current) {
+        const range = {start: start || null, end: end || null};
+        const gate = window.drDateFilterGate = window.drDateFilterGate || {};
+        clearTimeout(gate.timer);
+        if (current && current.start === range.start && current.end === range.end) {
+            return window.dash_clientside.no_update;
+        }
+
+        const triggered = window.dash_clientside.callback_context.triggered.map(t => t.prop_id);
+        const startOnly = triggered.includes('dr-date-filter.start_date')
+            && !triggered.includes('dr-date-filter.end_date');
+        if (current && startOnly) {
+            gate.timer = setTimeout(function() {
+                window.dash_clientside.set_props('dr-date-range', {data: range});
+            }, %d);
+            return window.dash_clientside.no_update;
+        }
+        return range;
+    }
+    """
+    % DATE_FILTER_DEBOUNCE_MS,
+    Output("dr-date-range", "data"),
     Input("dr-date-filter", "start_date"),
     Input("dr-date-filter", "end_date"),
+    State("dr-date-range", "data"),
+)
+
+
+# Filter row operators emitted by the DataTable (symbol and word forms)
+FILTER_COMPARISONS = {
+    "=": operator.eq,
+    "eq": operator.eq,
+    "!=": operator.ne,
+    "ne": operator.ne,
+    "<": operator.lt,
+    "lt": operator.lt,
+    "<=": operator.le,
+    "le": operator.le,
+    ">": operator.gt,
+    "gt": operator.gt,
+    ">=": operator.ge,
+    "ge": operator.ge,
+}
+
+# One filter row expression, e.g. {power_target} > 1000 or {description} icontains "shed"
+FILTER_PART = re.compile(
+    r"^\{(?P<column>[^}]+)\}\s+(?P<case>[si])?"
+    r"(?P<operator>!=|<=|>=|=|<|>|eq|ne|lt|le|gt|ge|contains|datestartswith)"
+    r"\s+(?P<value>.+)$"
+)
+
+
+def table_column(column_id: str) -> ColumnElement | None:
+    """Returns the SQL expression behind a DR events table column."""
+    return {
+        "id": PowerTarget.id,
+        "description": PowerTarget.description,
+        "date": PowerTarget.sql_start_time(),
+        "time": PowerTarget.sql_start_time(),
+        "duration": PowerTarget.sql_duration(),
+        "power_target": PowerTarget.subsystem_target,
+    }.get(column_id)
+
+
+def filter_part_clause(column_id: str, case: str | None, op: str, value: str):
+    """Translates one filter row expression into a WHERE clause.
+
+    Raises ValueError for values that don't parse for the column.
+    """
+    value = value.strip().strip("\"'`")
+    column = table_column(column_id)
+    if column_id == "description":
+        if op == "contains":
+            pattern = f"%{value}%"
+            return column.like(pattern) if case == "s" else column.ilike(pattern)
+        return FILTER_COMPARISONS[op](column, value)
+    if column_id == "date":
+        # "2026", "2026-01" and "2026-01-05" all match the whole year/month/day
+        period = pd.Period(value)
+        lower = period.start_time.tz_localize(UTC)
+        upper = (period + 1).start_time.tz_localize(UTC)
+        if op in ("contains", "datestartswith", "=", "eq"):
+            return and_(column >= lower, column < upper)
+        if op in ("!=", "ne"):
+            return or_(column < lower, column >= upper)
+        if op in ("<", "lt", ">=", "ge"):
+            return FILTER_COMPARISONS[op](column, lower)
+        return FILTER_COMPARISONS[op](column, upper if op in ("<=", "le") else lower)
+    if column_id == "duration":
+        # Durations display as "90 mins"; filter values are minutes
+        minutes = float(value.removesuffix("mins").strip())
+        compare = operator.eq if op == "contains" else FILTER_COMPARISONS[op]
+        return compare(column, pd.Timedelta(minutes=minutes))
+    if column_id in ("id", "power_target"):
+        compare = operator.eq if op == "contains" else FILTER_COMPARISONS[op]
+        return compare(column, float(value))
+    raise ValueError(f"Column {column_id} can't be filtered")
+
+
+def filter_query_clauses(filter_query: str | None) -> list[ColumnElement[bool]]:
+    """Translates the DataTable's filter_query into WHERE clauses.
+
+    Expressions that don't parse (or target a column that can't be filtered)
+    are skipped, the same as the table's native filtering ignores them.
+    """
+    clauses = []
+    for part in (filter_query or "").split(" && "):
+        match = FILTER_PART.match(part.strip())
+        if not match:
+            continue
+        try:
+            clauses.append(filter_part_clause(*match.group("column", "case", "operator", "value")))
+        except (ValueError, TypeError):
+            logger.debug(f"Ignoring DR events table filter: {part}")
+    return clauses
+
+
+def events_table_filters(
+    start_str: str | None,
+    end_str: str | None,
+    min_duration: float | None,
+    max_power: float | None,
+    filter_query: str | None = None,
+) -> list[ColumnElement[bool]]:
+    """Builds the WHERE clauses for the filter controls and the table's filter row."""
+    filters = []
+    if start_str:
+        filters.append(PowerTarget.sql_end_time() >= pd.to_datetime(start_str))
+    if end_str:
+        filters.append(PowerTarget.sql_start_time() <= pd.to_datetime(end_str))
+    if min_duration:
+        filters.append(PowerTarget.sql_duration() >= pd.Timedelta(minutes=min_duration))
+    if max_power:
+        filters.append(PowerTarget.subsystem_target <= max_power)
+    return filters + filter_query_clauses(filter_query)
+
+
+def events_table_query(filters: list[ColumnElement[bool]]) -> Select:
+    """Builds the DR events table query (unordered and unpaged).
+
+    The range bounds of target_period are selected as plain columns so the
+    database does the extraction instead of a per-row apply in pandas.
+    """
+    return (
+        select(
+            PowerTarget.id,
+            PowerTarget.description,
+            PowerTarget.subsystem_target.label("power_target"),
+            PowerTarget.sql_start_time().label("start_time"),
+            PowerTarget.sql_end_time().label("end_time"),
+        )
+        .where(*filters)
+    )
+
+
+def keyset_direction(sort_by: list[dict] | None) -> str | None:
+    """Returns "asc"/"desc" when the table is ordered by id alone (keyset-pageable), else None."""
+    if not sort_by:
+        return "desc"
+    if len(sort_by) == 1 and sort_by[0]["column_id"] == "id":
+        return sort_by[0]["direction"]
+    return None
+
+
+def events_filter_key(
+    start_str: str | None,
+    end_str: str | None,
+    min_duration: float | None,
+    max_power: float | None,
+    filter_query: str | None,
+) -> str:
+    """Normalizes the DR event filters into a query cache key.
+
+    Equivalent inputs ("1500" and 1500.0, differently formatted dates) share
+    a key; unset and zero are both "no filter", as in events_table_filters.
+    """
+    return json.dumps(
+        [
+            pd.Timestamp(start_str).isoformat() if start_str else None,
+            pd.Timestamp(end_str).isoformat() if end_str else None,
+            float(min_duration) if min_duration else None,
+            float(max_power) if max_power else None,
+            (filter_query or "").strip(),
+        ]
+    )
+
+
+class EventsPageOutOfRange(Exception):
+    """The requested DR events page starts past the last matching row (the cached count is stale)."""
+
+
+def count_events(filters: list[ColumnElement[bool]], cancellable=None) -> int:
+    """Counts the DR events matching the filters.
+
+    cancellable(connection), when given, is a context manager that cancels
+    the query if the request is superseded.
+    """
+    db_session = readonly_session_factory()
+    with db_session() as db:
+        with cancellable(db.connection()) if cancellable else nullcontext():
+            return (
+                db.execute(
+                    select(func.count()).select_from(PowerTarget).where(*filters)
+                ).scalar_one_or_none()
+                or 0
+            )
+
+
+def read_events_page(
+    filters: list[ColumnElement[bool]],
+    sort_by: list[dict] | None,
+    page_current: int,
+    page_size: int,
+    boundary: int | None,
+    cancellable=None,
+) -> list[EventTableDataEntry]:
+    """Reads and formats one page of the DR events table.
+
+    boundary is the last id of the previous page, when known, for keyset
+    pagination in id order. cancellable is as for count_events. Raises
+    EventsPageOutOfRange if the page starts past the last matching row.
+    """
+    direction = keyset_direction(sort_by)
+    db_session = readonly_session_factory()
+    with db_session() as db, cancellable(db.connection()) if cancellable else nullcontext():
+        query = events_table_query(filters)
+        if direction is None:
+            column = table_column(sort_by[0]["column_id"])  # pyright: ignore[reportOptionalSubscript]
+            order = column.desc() if sort_by[0]["direction"] == "desc" else column.asc()  # pyright: ignore[reportOptionalMemberAccess, reportOptionalSubscript]
+            query = query.order_by(order.nulls_last(), PowerTarget.id.desc()).offset(
+                page_current * page_size
+            )
+        else:
+            id_order = PowerTarget.id.desc() if direction == "desc" else PowerTarget.id.asc()
+            query = query.order_by(id_order)
+            if page_current > 0:
+                if boundary is None:
+                    # Jumped to a page whose predecessor hasn't been read: find its
+                    # last id with an id-only OFFSET scan instead of reading rows
+                    boundary = db.execute(
+                        select(PowerTarget.id)
+                        .where(*filters)
+                        .order_by(id_order)
+                        .offset(page_current * page_size - 1)
+                        .limit(1)
+                    ).scalar_one_or_none()
+                    if boundary is None:
+                        raise EventsPageOutOfRange(page_current)
+                query = query.where(
+                    PowerTarget.id < boundary if direction == "desc" else PowerTarget.id > boundary
+                )
+        df = pd.read_sql(query.limit(page_size), db.connection())
+
+    return format_events_table(df)
+
+
+@callback(
+    Output("dr-events-table", "data"),
+    Output("dr-events-table", "page_count"),
+    Output("dr-events-table", "page_current"),
+    Output("dr-events-cursors", "data"),
+    Input("dr-date-range", "data"),
     Input("dr-duration-filter", "value"),
     Input("dr-power-filter", "value"),
+    Input("dr-events-table", "page_current"),
+    Input("dr-events-table", "page_size"),
+    Input("dr-events-table", "sort_by"),
+    Input("dr-events-table", "filter_query"),
+    State("dr-events-cursors", "data"),
+    State("dr-events-tab", "data"),
 )
 def filter_dr_events_table(
+    date_range: dict | None,
+    min_duration: float,
+    max_power: float,
+    page_current: int | None,
+    page_size: int | None,
+    sort_by: list[dict] | None,
+    filter_query: str | None,
+    cursors: dict | None,
+    tab_id: str | None,
+) -> tuple[list[EventTableDataEntry], int, int, dict]:
+    """Fetches the visible page of the DR events table.
+
+    Filters and sort run in SQL, and counts and pages come from the shared
+    query cache when another worker has already read them. Pages in id order
+    are read by keyset from the previous page's last id (kept in
+    dr-events-cursors); other sorts fall back to OFFSET. Date and numeric
+    filters arrive debounced, and queries still running when a newer request
+    from the same tab arrives are cancelled.
+    """
+    date_range = date_range or {}
+    request_key = f"{tab_id}:filter_dr_events_table" if tab_id else None
+    token = LATEST_REQUESTS.begin(request_key)
+
+    def cancellable(connection):
+        return LATEST_REQUESTS.cancel_superseded(request_key, token, connection)
+
+    try:
+        return read_events_table(
+            date_range.get("start"),
+            date_range.get("end"),
+            min_duration,
+            max_power,
+            page_current,
+            page_size,
+            sort_by,
+            filter_query,
+            cursors,
+            cancellable,
+        )
+    except SupersededError:
+        # The renderer has already dropped this request in favour of the newer one
+        raise PreventUpdate
+
+
+def read_events_table(
     start_str: str,
     end_str: str,
     min_duration: float,
     max_power: float,
-) -> list[EventTableDataEntry]:
-    """Filters the DR events table based on user-selected criteria."""
-    db_session = readonly_session_factory()
-    with db_session() as db:
-        query = Select[tuple[PowerTarget]](PowerTarget).order_by(PowerTarget.id.desc())
-        if start_str:
-            query = query.where(PowerTarget.sql_end_time() >= pd.to_datetime(start_str))
-        if end_str:
-            query = query.where(PowerTarget.sql_start_time() <= pd.to_datetime(end_str))
-        if min_duration:
-            query = query.where(
-                PowerTarget.sql_duration() >= pd.Timedelta(minutes=min_duration)
-            )
-        if max_power:
-            query = query.where(PowerTarget.subsystem_target <= max_power)
-        df = pd.read_sql(query, db.connection())
-        if not df.empty:
-            df["start_time"] = df["target_period"].apply(lambda x: x.lower)
-            df["end_time"] = df["target_period"].apply(lambda x: x.upper)
-            df["duration_mins"] = df.apply(
-                lambda x: (x["end_time"] - x["start_time"]).total_seconds() / 60,
-                axis=1,
-            )
-            df = df.rename(columns={"subsystem_target": "power_target"})
+    page_current: int | None,
+    page_size: int | None,
+    sort_by: list[dict] | None,
+    filter_query: str | None,
+    cursors: dict | None,
+    cancellable,
+) -> tuple[list[EventTableDataEntry], int, int, dict]:
+    """Reads the count and visible page for filter_dr_events_table."""
+    page_size = page_size or EVENTS_PAGE_SIZE
+    requested_page = page_current or 0
+    page_current = requested_page
+    filter_key = events_filter_key(
+        start_str, end_str, min_duration, max_power, filter_query
+    )
+    key = json.dumps([filter_key, sort_by, page_size])
+    if not cursors or cursors["key"] != key:
+        # New filters or sort: recount and start again from the first page
+        cursors = {"key": key, "last_ids": {}}
+        page_current = 0
 
-    if df.empty:
-        return []
+    filters = events_table_filters(
+        start_str, end_str, min_duration, max_power, filter_query
+    )
+    # Re-read on every request (a cache hit) so invalidation and the TTL apply
+    for _attempt in range(2):
+        count = QUERY_CACHE.get_or_create(
+            DR_EVENTS_CACHE,
+            f"count {filter_key}",
+            lambda: count_events(filters, cancellable),
+        )
+        page_count = max(math.ceil(count / page_size), 1)
+        page_current = min(page_current, page_count - 1)
 
-    return format_table_data(df)
+        boundary = cursors["last_ids"].get(str(page_current - 1))
+        try:
+            data = QUERY_CACHE.get_or_create(
+                DR_EVENTS_CACHE,
+                # The boundary decides which rows a keyset page holds, so it's part of the key
+                f"page {key} {page_current} {boundary}",
+                lambda: read_events_page(
+                    filters, sort_by, page_current, page_size, boundary, cancellable
+                ),
+            )
+            break
+        except EventsPageOutOfRange:
+            # Rows went away since the count was cached: drop it and recount
+            QUERY_CACHE.invalidate(DR_EVENTS_CACHE)
+    else:
+        data = []
+    if keyset_direction(sort_by) is not None and data:
+        cursors["last_ids"][str(page_current)] = data[-1]["id"]
+
+    return (
+        data,
+        page_count,
+        page_current if page_current != requested_page else dash.no_update,
+        cursors,
+    )
 
 
 @callback(
@@ -435,10 +839,25 @@ def filter_dr_events_table(
     [
         State("analysis-window", "data"),
     ],
+    # Runs in a separate process so request workers stay free; a new analysis
+    # window terminates the running job before starting the next one
+    background=True,
+    manager=BACKGROUND_MANAGER,
+    interval=ANALYSIS_POLL_MS,
+    progress=[
+        Output("analysis-progress-bar", "value"),
+        Output("analysis-progress-label", "children"),
+    ],
+    progress_default=[0, ""],
+    running=[
+        (Output("analysis-progress", "style"), {"display": "block"}, {"display": "none"}),
+    ],
+    cancel=[Input("cancel-analysis-button", "n_clicks")],
     prevent_initial_call=True,
 )
+@instrument_job
 def plot_selected_events(
-    n_clicks: int, analysis_window: AnalysisWindowData | None
+    set_progress, n_clicks: int, analysis_window: AnalysisWindowData | None
 ) -> html.Div:
     """Plot the selected DR events for comparison."""
     if not analysis_window:
@@ -448,8 +867,10 @@ def plot_selected_events(
     end_time = datetime.fromisoformat(analysis_window["end"])
 
     # Get all affected jobs
+    set_progress((10, "Loading jobs..."))
     job_ids = job_ids_in_time_window(start=start_time, end=end_time)
 
+    set_progress((40, "Loading targets..."))
     power_targets = power_targets_in_time_window(
         start=start_time, end=end_time, include_conflicting=True
     )
@@ -462,6 +883,7 @@ def plot_selected_events(
     }
 
     # Create event summary cards
+    set_progress((70, "Building figures..."))
     event_summary_cards = []
 
     for details in power_targets:
@@ -0,0 +1,44 @@
+# Gunicorn configuration for production (`gunicorn app:server -c gunicorn.conf.py`)
+from config import (
+    PORT,
+    WEB_WORKERS,
+    WEB_THREADS,
+    WEB_PRELOAD,
+    WEB_TIMEOUT,
+    WEB_GRACEFUL_TIMEOUT,
+    WEB_KEEPALIVE,
+    WEB_MAX_REQUESTS,
+    WEB_MAX_REQUESTS_JITTER,
+)
+
+bind = f'0.0.0.0:{PORT}'
+
+# Worker model - processes x threads (gthread handles concurrent callbacks per worker)
+workers = WEB_WORKERS
+threads = WEB_THREADS
+worker_class = 'gthread'
+
+# Import the app once in the master so workers fork with pages and layout ready
+preload_app = WEB_PRELOAD
+
+# Timeouts and graceful restarts (SIGHUP reloads workers without dropping requests)
+timeout = WEB_TIMEOUT
+graceful_timeout = WEB_GRACEFUL_TIMEOUT
+keepalive = WEB_KEEPALIVE
+
+# Recycle workers periodically to bound memory growth; jitter avoids restarting all at once
+max_requests = WEB_MAX_REQUESTS
+max_requests_jitter = WEB_MAX_REQUESTS_JITTER
+
+accesslog = '-'
+errorlog = '-'
+
+
+def post_fork(server, worker):
+    """Open the worker's read-only database connections before it takes requests."""
+    from db_pool import warm_pool
+    try:
+        warm_pool()
+    except Exception as e:
+        # The pool connects lazily instead; readiness reports the database as failing
+        server.log.warning('Database pool warmup failed in worker %s: %s', worker.pid, e)
@@ -0,0 +1,155 @@
+# Liveness and readiness checks for the load balancer / Railway and the /dev/health page
+import os
+import threading
+import time
+
+from dash import page_registry
+from flask import g, jsonify
+from sqlalchemy import text
+
+import db_pool
+from config import HEALTH_CHECK_INTERVAL, WEB_THREADS
+
+LIVE_PATH = '/dev/health/live'
+READY_PATH = '/dev/health/ready'
+
+
+class HealthState:
+    """Worker health: startup progress, in-flight requests, dependency checks and caches.
+
+    Everything reported is cheap to compute - nothing here builds layouts or
+    runs callbacks, and dependency checks are cached for HEALTH_CHECK_INTERVAL.
+    """
+
+    def __init__(self, threads: int = WEB_THREADS):
+        self.threads = threads
+        self.pages_registered = False
+        self.layout_ready = False
+        self.checks = {}   # name -> (check function, critical)
+        self.caches = {}   # name -> stats function
+        self._results = {}  # name -> (checked at, result)
+        self.reset_worker()
+
+    def reset_worker(self):
+        """Start the uptime clock for this process (called again in forked workers)."""
+        self.pid = os.getpid()
+        self.started = time.time()
+        self._in_flight = {}  # request token -> start time
+        self._lock = threading.Lock()
+
+    def register_check(self, name: str, check, critical: bool = True):
+        """Add a dependency check; check() returns a details dict or raises on failure."""
+        self.checks[name] = (check, critical)
+
+    def register_cache(self, name: str, stats):
+        """Report a cache's stats() (and whether it is warm) in the health report."""
+        self.caches[name] = stats
+
+    def request_started(self) -> object:
+        """Mark a request as in flight; returns a token for request_finished()."""
+        token = object()
+        with self._lock:
+            self._in_flight[token] = time.time()
+        return token
+
+    def request_finished(self, token: object):
+        """Mark a request as done."""
+        with self._lock:
+            self._in_flight.pop(token, None)
+
+    def saturation(self) -> dict:
+        """In-flight requests against the worker's thread pool."""
+        now = time.time()
+        with self._lock:
+            started = list(self._in_flight.values())
+        return {
+            'in_flight': len(started),
+            'threads': self.threads,
+            'utilization': len(started) / self.threads,
+            'oldest_request_s': now - min(started) if started else 0.0,
+        }
+
+    def run_check(self, name: str) -> dict:
+        """Run a dependency check, reusing a recent result."""
+        now = time.time()
+        cached = self._results.get(name)
+        if cached is not None and now - cached[0] < HEALTH_CHECK_INTERVAL:
+            return cached[1]
+
+        check, critical = self.checks[name]
+        start = time.perf_counter()
+        try:
+            result = {'ok': True, **(check() or {})}
+        except Exception as e:
+            result = {'ok': False, 'error': f'{type(e).__name__}: {e}'}
+        result.update(critical=critical, latency_ms=(time.perf_counter() - start) * 1000, checked_at=now)
+        self._results[name] = (now, result)
+        return result
+
+    def cache_report(self) -> dict:
+        """Stats of each registered cache; warm once it holds entries."""
+        report = {}
+        for name, stats in self.caches.items():
+            cache_stats = stats()
+            report[name] = {'warm': bool(cache_stats.get('size') or cache_stats.get('endpoints')), **cache_stats}
+        return report
+
+    def liveness(self) -> dict:
+        """The worker is up and can serve a request."""
+        return {'status': 'alive', 'pid': self.pid, 'uptime_s': time.time() - self.started}
+
+    def readiness(self) -> tuple:
+        """Get (ready, report): pages registered, layout set and critical checks passing."""
+        checks = {name: self.run_check(name) for name in self.checks}
+        ready = (
+            self.pages_registered
+            and self.layout_ready
+            and all(result['ok'] for result in checks.values() if result['critical'])
+        )
+        return ready, {
+            'status': 'ready' if ready else 'not_ready',
+            'pid': self.pid,
+            'uptime_s': time.time() - self.started,
+            'pages_registered': self.pages_registered,
+            'pages': len(page_registry),
+            'layout_ready': self.layout_ready,
+            'checks': checks,
+            'caches': self.cache_report(),
+            'saturation': self.saturation(),
+        }
+
+
+HEALTH = HealthState()
+os.register_at_fork(after_in_child=HEALTH.reset_worker)
+
+
+def check_readonly_database() -> dict:
+    """Run SELECT 1 on a pooled read-only connection (skipped if no database is configured)."""
+    if not db_pool.is_configured():
+        return {'configured': False}
+    with db_pool.get_engine().connect() as connection:
+        connection.execute(text('SELECT 1'))
+    return {'configured': True, **db_pool.pool_gauges()}
+
+
+def init_health(server, state: HealthState = HEALTH) -> HealthState:
+    """Track in-flight requests and add the liveness and readiness endpoints."""
+    @server.before_request
+    def track_request_start():
+        g.health_token = state.request_started()
+
+    @server.teardown_request
+    def track_request_end(_exc=None):
+        state.request_finished(g.pop('health_token', None))
+
+    def live():
+        return jsonify(state.liveness())
+
+    def ready():
+        is_ready, report = state.readiness()
+        return jsonify(report), 200 if is_ready else 503
+
+    server.add_url_rule(LIVE_PATH, endpoint='health_live', view_func=live)
+    server.add_url_rule(READY_PATH, endpoint='health_ready', view_func=ready)
+    state.register_check('readonly_db', check_readonly_database)
+    return state
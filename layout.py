@@ -4,7 +4,22 @@ import emerald_ui_components as eui
 
 from components.sidebar import create_sidebar
 from components.header import create_header
-from navigation import DEFAULT_PERSONA
+from breadcrumbs import create_breadcrumb_store
+from config import NAV_CLIENTSIDE_HIGHLIGHT, BREADCRUMBS_CLIENTSIDE
+from navigation import DEFAULT_PERSONA, NAV_INDEX
+
+
+def create_nav_stores():
+    """Create the stores used for clientside active-item highlighting."""
+    if not NAV_CLIENTSIDE_HIGHLIGHT:
+        return []
+    return [
+        dcc.Store(id='sidebar-nav-ids', data={
+            'default': DEFAULT_PERSONA['key'],
+            'personas': NAV_INDEX.persona_items,
+        }),
+        dcc.Store(id='sidebar-nav-active'),
+    ]
 
 
 def create_layout():
@@ -16,6 +31,8 @@ def create_layout():
             # State storage
             dcc.Location(id='url', refresh=False),
             dcc.Store(id='persona-store', data=DEFAULT_PERSONA, storage_type='local'),
+            *create_nav_stores(),
+            *([create_breadcrumb_store()] if BREADCRUMBS_CLIENTSIDE else []),
 
             # Main layout
             eui.SidebarProvider(
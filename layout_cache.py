@@ -0,0 +1,121 @@
+# Serialized /_dash-layout and /_dash-dependencies cache with ETag/304 support
+import hashlib
+import threading
+
+from dash import page_registry
+from dash._callback import GLOBAL_CALLBACK_LIST
+from flask import Response, request
+
+# Endpoints whose JSON only changes when pages, callbacks or the layout change
+CACHED_ENDPOINTS = ['_dash-layout', '_dash-dependencies']
+
+# Browsers may keep the body but must revalidate (cheap 304) on every load
+CACHE_CONTROL = 'no-cache'
+
+
+class LayoutResponseCache:
+    """Caches the serialized bytes of Dash's layout and dependencies responses.
+
+    Entries are keyed by a fingerprint of the registered pages, callbacks and
+    layout object, so registering a page or callback invalidates them.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self.entries = {}  # endpoint -> (fingerprint, body, etag, mimetype)
+        self.hits = 0
+        self.misses = 0
+        self.not_modified = 0
+        self._lock = threading.Lock()
+
+    def fingerprint(self) -> tuple:
+        """Cheap identity of everything the cached responses depend on."""
+        return (
+            len(page_registry),
+            len(self.app.callback_map),
+            len(GLOBAL_CALLBACK_LIST),
+            id(self.app.layout),
+        )
+
+    def wrap(self, endpoint: str, view):
+        """Wrap a Dash view function so it serves cached bytes with an ETag."""
+        def cached_view(*args, **kwargs):
+            # Layout functions build a new tree per request - nothing to cache
+            if endpoint.endswith('_dash-layout') and callable(self.app.layout):
+                return view(*args, **kwargs)
+
+            key = self.fingerprint()
+            entry = self.entries.get(endpoint)
+            if entry is None or entry[0] != key:
+                response = view(*args, **kwargs)
+                body = response.get_data()
+                etag = hashlib.sha256(body).hexdigest()[:32]
+                entry = (key, body, etag, response.mimetype)
+                with self._lock:
+                    self.entries[endpoint] = entry
+                    self.misses += 1
+            else:
+                with self._lock:
+                    self.hits += 1
+
+            _, body, etag, mimetype = entry
+            matched = matching_etag(etag)
+            if matched:
+                with self._lock:
+                    self.not_modified += 1
+                # Echo the validator the client holds (it may carry an encoding suffix)
+                response = Response(status=304)
+                response.set_etag(matched)
+            else:
+                response = Response(body, mimetype=mimetype)
+                response.set_etag(etag)
+            response.headers['Cache-Control'] = CACHE_CONTROL
+            return response
+
+        cached_view.__name__ = getattr(view, '__name__', 'cached_view')
+        return cached_view
+
+    def clear(self):
+        """Drop cached responses (they are rebuilt on the next request)."""
+        with self._lock:
+            self.entries.clear()
+
+    def stats(self) -> dict:
+        """Get cache state and hit/miss/304 counters."""
+        with self._lock:
+            return {
+                'endpoints': sorted(self.entries),
+                'hits': self.hits,
+                'misses': self.misses,
+                'not_modified': self.not_modified,
+            }
+
+
+def matching_etag(etag: str) -> str:
+    """Get the If-None-Match validator naming this ETag, or None.
+
+    The compression layer suffixes ETags with the encoding ("abc:br"), so
+    compare on the part before the colon.
+    """
+    header = request.headers.get('If-None-Match')
+    if not header:
+        return None
+    for candidate in header.split(','):
+        candidate = candidate.strip()
+        if candidate == '*':
+            return etag
+        if candidate.startswith('W/'):
+            candidate = candidate[2:]
+        candidate = candidate.strip('"')
+        if candidate.split(':')[0] == etag:
+            return candidate
+    return None
+
+
+def init_layout_cache(app) -> LayoutResponseCache:
+    """Serve /_dash-layout and /_dash-dependencies from a LayoutResponseCache."""
+    cache = LayoutResponseCache(app)
+    for name in CACHED_ENDPOINTS:
+        endpoint = app.config.routes_pathname_prefix + name
+        app.server.view_functions[endpoint] = cache.wrap(endpoint, app.server.view_functions[endpoint])
+    return cache
@@ -0,0 +1,190 @@
+# Per-callback latency, payload size, error and rate metrics for Dash callbacks
+import bisect
+import threading
+import time
+from collections import deque
+
+from flask import g, jsonify, request
+
+# Latency histogram bucket upper bounds in milliseconds (the last bucket is +inf)
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+# Recent latencies kept per callback for percentiles
+RECENT_SAMPLES = 1000
+
+# Window for the invocation rate
+RATE_WINDOW = 60
+
+
+def percentile(values: list, pct: float) -> float:
+    """Get a percentile (0-100) of a sorted list by nearest rank."""
+    if not values:
+        return 0.0
+    index = min(len(values) - 1, max(0, round(pct / 100 * len(values)) - 1))
+    return values[index]
+
+
+class CallbackStats:
+    """Running metrics for one callback (callers hold CallbackMetrics' lock)."""
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.recent = deque(maxlen=RECENT_SAMPLES)
+        self.calls = deque()  # timestamps within RATE_WINDOW
+        self.last_called = None
+
+    def record(self, elapsed_ms: float, request_bytes: int, response_bytes: int, error: bool, now: float):
+        self.count += 1
+        self.errors += int(error)
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+        self.request_bytes += request_bytes
+        self.response_bytes += response_bytes
+        self.buckets[bisect.bisect_left(LATENCY_BUCKETS_MS, elapsed_ms)] += 1
+        self.recent.append(elapsed_ms)
+        self.calls.append(now)
+        self.last_called = now
+
+    def snapshot(self, now: float) -> dict:
+        while self.calls and self.calls[0] < now - RATE_WINDOW:
+            self.calls.popleft()
+        recent = sorted(self.recent)
+        return {
+            'count': self.count,
+            'errors': self.errors,
+            'error_rate': self.errors / self.count if self.count else 0.0,
+            'rate_per_min': len(self.calls) * 60 / RATE_WINDOW,
+            'mean_ms': self.total_ms / self.count if self.count else 0.0,
+            'p50_ms': percentile(recent, 50),
+            'p95_ms': percentile(recent, 95),
+            'p99_ms': percentile(recent, 99),
+            'max_ms': self.max_ms,
+            'request_bytes': self.request_bytes,
+            'response_bytes': self.response_bytes,
+            'mean_request_bytes': self.request_bytes / self.count if self.count else 0.0,
+            'mean_response_bytes': self.response_bytes / self.count if self.count else 0.0,
+            'histogram': {
+                'buckets_ms': list(LATENCY_BUCKETS_MS) + ['+Inf'],
+                'counts': list(self.buckets),
+            },
+            'last_called': self.last_called,
+        }
+
+
+class CallbackMetrics:
+    """Thread-safe registry of CallbackStats keyed by callback name."""
+
+    def __init__(self):
+        self.started = time.time()
+        self.callbacks = {}
+        self.gauges = {}  # name -> function returning a dict of current values
+        self.sources = []  # functions returning timings recorded elsewhere (background jobs)
+        self._lock = threading.Lock()
+
+    def register_gauges(self, name: str, gauges):
+        """Add a gauge group (e.g. database pool occupancy) to the snapshot."""
+        self.gauges[name] = gauges
+
+    def register_source(self, source):
+        """Add a function returning new (name, elapsed_ms, error, finished_at) timings, read on snapshot."""
+        self.sources.append(source)
+
+    def record(self, name: str, elapsed_ms: float, request_bytes: int, response_bytes: int, error: bool,
+               now: float = None):
+        """Record one callback invocation (that finished at now, by default the current time)."""
+        now = time.time() if now is None else now
+        with self._lock:
+            stats = self.callbacks.get(name)
+            if stats is None:
+                stats = self.callbacks[name] = CallbackStats()
+            stats.record(elapsed_ms, request_bytes, response_bytes, error, now)
+
+    def record_timing(self, name: str, elapsed_ms: float):
+        """Record a timed step inside a callback (no request or response payload of its own)."""
+        self.record(name, elapsed_ms, 0, 0, error=False)
+
+    def reset(self):
+        """Drop all recorded metrics."""
+        with self._lock:
+            self.callbacks.clear()
+            self.started = time.time()
+
+    def snapshot(self) -> dict:
+        """Get metrics for every callback, busiest first, and the current gauges."""
+        for source in self.sources:
+            for name, elapsed_ms, error, finished_at in source():
+                self.record(name, elapsed_ms, 0, 0, error, now=finished_at)
+        now = time.time()
+        with self._lock:
+            callbacks = {name: stats.snapshot(now) for name, stats in self.callbacks.items()}
+            started = self.started
+        return {
+            'since': started,
+            'uptime_s': now - started,
+            'callbacks': dict(sorted(callbacks.items(), key=lambda item: -item[1]['count'])),
+            'gauges': {name: gauges() for name, gauges in self.gauges.items()},
+        }
+
+
+CALLBACK_METRICS = CallbackMetrics()
+
+
+def callback_name(app, output: str) -> str:
+    """Get the function name of the callback that updates an output."""
+    callback = app.callback_map.get(output, {}).get('callback')
+    if callback is None:
+        return output
+    return getattr(callback, '__name__', output)
+
+
+def is_background_callback(app, output: str) -> bool:
+    """Whether the callback that updates an output runs as a background job."""
+    return bool(app.callback_map.get(output, {}).get('background'))
+
+
+def init_callback_metrics(app, metrics: CallbackMetrics = CALLBACK_METRICS) -> CallbackMetrics:
+    """Time every /_dash-update-component request and serve the metrics as JSON.
+
+    Requests for background callbacks only submit or poll a job, so they're
+    not counted; the job's own time comes from a registered source instead.
+    """
+    server = app.server
+    update_path = app.config.routes_pathname_prefix + '_dash-update-component'
+
+    @server.before_request
+    def start_callback_timer():
+        if request.path == update_path:
+            g.callback_started = time.perf_counter()
+
+    @server.after_request
+    def record_callback_metrics(response):
+        started = g.pop('callback_started', None)
+        if started is None:
+            return response
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        body = request.get_json(silent=True) or {}
+        output = body.get('output', '')
+        if is_background_callback(app, output):
+            return response
+        # Registered after compression, so this runs first and sees the uncompressed size
+        metrics.record(
+            callback_name(app, output),
+            elapsed_ms,
+            request.content_length or 0,
+            response.calculate_content_length() or 0,
+            error=response.status_code >= 400,
+        )
+        return response
+
+    server.add_url_rule(
+        '/dev/metrics.json',
+        endpoint='callback_metrics',
+        view_func=lambda: jsonify(metrics.snapshot()),
+    )
+    return metrics
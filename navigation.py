@@ -1,6 +1,7 @@
 # Navigation configuration for different personas
 # Icons use Lucide icon names - see https://lucide.dev/icons
 # Based on PRD navigation architecture
+import re
 
 # =============================================================================
 # PERSONA DEFINITIONS
@@ -8,7 +9,6 @@
 
 PERSONAS = [
     {
-        'id': 'persona-grid-operator',
         'key': 'grid_operator',
         'name': 'Grid Operator',
         'description': 'Grid stability & DR management',
@@ -17,7 +17,6 @@ PERSONAS = [
         'shortcut': '⌘1',
     },
     {
-        'id': 'persona-csp-operator',
         'key': 'csp_operator',
         'name': 'CSP Operator',
         'description': 'Tenant flexibility & commitments',
@@ -26,7 +25,6 @@ PERSONAS = [
         'shortcut': '⌘2',
     },
     {
-        'id': 'persona-compute-user',
         'key': 'compute_user',
         'name': 'Compute User',
         'description': 'AI/ML workloads & jobs',
@@ -35,7 +33,6 @@ PERSONAS = [
         'shortcut': '⌘3',
     },
     {
-        'id': 'persona-internal',
         'key': 'internal',
         'name': 'Emerald Internal',
         'description': 'Full access & dev tools',
@@ -48,6 +45,68 @@ PERSONAS = [
 # Default persona (shown on load)
 DEFAULT_PERSONA = PERSONAS[2]  # Compute User
 
+# Map persona keys to their definitions
+PERSONAS_BY_KEY = {persona['key']: persona for persona in PERSONAS}
+
+
+def get_persona(persona_key: str) -> dict:
+    """Get a persona definition by key, or None if unknown."""
+    return PERSONAS_BY_KEY.get(persona_key)
+
+
+# Longest word prefix kept in the persona search index (longer query words are verified per match)
+SEARCH_PREFIX_LENGTH = 8
+
+
+def search_words(text: str) -> list:
+    """Split text into lowercase search words."""
+    return re.findall(r'\w+', (text or '').lower())
+
+
+class PersonaSearchIndex:
+    """Word-prefix index over persona names and descriptions.
+
+    A search looks up each query word's prefix and intersects the matches, so
+    it doesn't scan every persona; results keep the PERSONAS order.
+    """
+
+    def __init__(self, personas: list):
+        self.personas = personas
+        self.words = []     # position -> persona's search words
+        self.prefixes = {}  # word prefix -> set of persona positions
+        for position, persona in enumerate(personas):
+            words = search_words(f'{persona["name"]} {persona["description"]}')
+            self.words.append(words)
+            for word in words:
+                for length in range(1, min(len(word), SEARCH_PREFIX_LENGTH) + 1):
+                    self.prefixes.setdefault(word[:length], set()).add(position)
+
+    def search(self, query: str = None) -> list:
+        """Get the positions of personas with a word starting with every query word."""
+        query_words = search_words(query)
+        if not query_words:
+            return list(range(len(self.personas)))
+        matches = set.intersection(*(
+            self.prefixes.get(word[:SEARCH_PREFIX_LENGTH], set()) for word in query_words
+        ))
+        long_words = [word for word in query_words if len(word) > SEARCH_PREFIX_LENGTH]
+        if long_words:
+            matches = {
+                position for position in matches
+                if all(any(word.startswith(long_word) for word in self.words[position]) for long_word in long_words)
+            }
+        return sorted(matches)
+
+
+PERSONA_SEARCH_INDEX = PersonaSearchIndex(PERSONAS)
+
+
+def search_personas(query: str = None, offset: int = 0, limit: int = None) -> tuple:
+    """Get one page of personas matching a query, and the total number of matches."""
+    positions = PERSONA_SEARCH_INDEX.search(query)
+    page = positions[offset:offset + limit] if limit else positions[offset:]
+    return [PERSONAS[position] for position in page], len(positions)
+
 # =============================================================================
 # GRID OPERATOR NAVIGATION (GO-*)
 # =============================================================================
@@ -489,24 +548,106 @@ PERSONA_NAVIGATION = {
 }
 
 
+# =============================================================================
+# NAVIGATION INDEX
+# =============================================================================
+
+class NavigationIndex:
+    """Precomputed lookups over the persona navigation config.
+
+    Built once at import so URL-change callbacks do dict lookups instead of
+    walking every persona, section and item. When the same href appears under
+    several personas, the first occurrence wins (matching stub registration).
+    After editing the nav config, call rebuild(): it rebuilds the lookups in
+    place and runs the on_rebuild hooks that drop caches derived from them.
+    """
+
+    def __init__(self, persona_navigation: dict):
+        self.persona_navigation = persona_navigation
+        self._rebuild_hooks = []
+        self._build()
+
+    def _build(self):
+        self.pages = {}              # href -> page info
+        self.persona_hrefs = {}      # persona key -> tuple of hrefs, in nav order
+        self.persona_href_sets = {}  # persona key -> frozenset of hrefs
+        self.persona_items = {}      # persona key -> {nav id: href}
+        self.breadcrumb_names = {}   # path prefix -> display name
+
+        for persona_key, nav in self.persona_navigation.items():
+            hrefs = []
+            item_hrefs = {}
+            for section in nav:
+                for item in section.get('items', []):
+                    href = item.get('href')
+                    if not href:
+                        continue
+                    hrefs.append(href)
+                    item_hrefs[item['id']] = href
+                    if href not in self.pages:
+                        self.pages[href] = {
+                            'title': item['title'],
+                            'description': item.get('description', ''),
+                            'section': section['title'],
+                            'icon': section.get('icon', 'File')
+                        }
+                        self.breadcrumb_names[href] = item['title']
+            self.persona_hrefs[persona_key] = tuple(hrefs)
+            self.persona_href_sets[persona_key] = frozenset(hrefs)
+            self.persona_items[persona_key] = item_hrefs
+
+    def on_rebuild(self, hook):
+        """Register a function (e.g. a cache's clear) to call after every rebuild."""
+        self._rebuild_hooks.append(hook)
+        return hook
+
+    def rebuild(self):
+        """Re-read the nav config after it changed and invalidate everything cached from it."""
+        self._build()
+        for hook in self._rebuild_hooks:
+            hook()
+
+    @property
+    def hrefs(self) -> set:
+        """All unique hrefs across every persona."""
+        return set(self.pages)
+
+    def navigation(self, persona_key: str) -> list:
+        """Get the navigation config for a persona, falling back to Compute User."""
+        return self.persona_navigation.get(persona_key, NAV_COMPUTE_USER)
+
+    def hrefs_for(self, persona_key: str) -> frozenset:
+        """Get the set of hrefs shown to a persona, falling back to Compute User."""
+        if persona_key not in self.persona_href_sets:
+            persona_key = 'compute_user'
+        return self.persona_href_sets.get(persona_key, frozenset())
+
+    def ordered_hrefs_for(self, persona_key: str) -> tuple:
+        """Get the hrefs shown to a persona in navigation order, falling back to Compute User."""
+        if persona_key not in self.persona_hrefs:
+            persona_key = 'compute_user'
+        return self.persona_hrefs.get(persona_key, ())
+
+    def page_info(self, href: str) -> dict:
+        """Get page info (title, description, section, icon) for an href."""
+        return self.pages.get(href)
+
+    def breadcrumb_name(self, path: str) -> str:
+        """Get the display name for a path prefix, or None if unknown."""
+        return self.breadcrumb_names.get(path)
+
+
+NAV_INDEX = NavigationIndex(PERSONA_NAVIGATION)
+
+
 def get_navigation_for_persona(persona_key: str) -> list:
     """Get the navigation config for a given persona key."""
-    return PERSONA_NAVIGATION.get(persona_key, NAV_COMPUTE_USER)
+    return NAV_INDEX.navigation(persona_key)
 
 
 def get_page_info(href: str) -> dict:
     """Get page info (title, description, icon) for a given href."""
-    for nav in PERSONA_NAVIGATION.values():
-        for section in nav:
-            for item in section.get('items', []):
-                if item.get('href') == href:
-                    return {
-                        'title': item['title'],
-                        'description': item.get('description', ''),
-                        'section': section['title'],
-                        'icon': section.get('icon', 'File')
-                    }
-    return None
+    return NAV_INDEX.page_info(href)
 
 
 # Legacy - for backwards compatibility during transition
@@ -1,9 +1,13 @@
 from dash import html, register_page, callback, Input, Output
 import emerald_ui_components as eui
 
+from components.icon import create_icon
+from render_cache import freeze_layout
+
 register_page(__name__, path='/cluster/overview', name='Overview')
 
-layout = html.Div([
+# Static page - built and serialized once, then served from cache
+layout = freeze_layout(html.Div([
     # html.H3(children='Welcome to Emerald AI', className='text-4xl'),
     eui.PageHeader(
         heading='Cluster Overview',
@@ -13,13 +17,13 @@ layout = html.Div([
             eui.Button(
                 variant='outline',
                 children=[
-                    eui.Icon(name='lucide:rotate-ccw', className='mr-2'),
+                    create_icon('lucide:rotate-ccw', className='mr-2'),
                     'Reset'
                 ]
             ),
             eui.Button(
                 children=[
-                    eui.Icon(name='lucide:save', className='mr-2'),
+                    create_icon('lucide:save', className='mr-2'),
                     'Save changes'
                 ]
             ),
@@ -139,7 +143,7 @@ layout = html.Div([
             ]
         ),
     ], className='flex flex-1 flex-col gap-4 p-6'),
-])
+]))
 
 
 # Callback to show which menu item was clicked
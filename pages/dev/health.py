@@ -0,0 +1,107 @@
+from dash import html, dcc, register_page, callback, Input, Output
+import emerald_ui_components as eui
+
+from health import HEALTH, LIVE_PATH, READY_PATH
+
+register_page(__name__, path='/dev/health', name='System Health')
+
+# Seconds between refreshes of the health report
+REFRESH_INTERVAL = 5
+
+
+def create_status_badge(ok: bool, label: str = None):
+    """Create a green/red status badge."""
+    return eui.Badge(
+        children=label or ('OK' if ok else 'Failing'),
+        variant='default' if ok else 'destructive',
+    )
+
+
+def create_stat(label: str, value, ok: bool = None):
+    """Create a labelled stat, with a status badge when ok is given."""
+    return html.Div([
+        html.Span(label, className='text-sm text-muted-foreground'),
+        html.Div([
+            html.Span(str(value), className='text-2xl font-normal tabular-nums'),
+            create_status_badge(ok) if ok is not None else None,
+        ], className='flex items-center gap-2'),
+    ], className='flex flex-col gap-1')
+
+
+def create_detail_rows(details: dict):
+    """Create key/value rows for a check or cache."""
+    return html.Dl([
+        html.Div([
+            html.Dt(key, className='text-muted-foreground'),
+            html.Dd(f'{value:.2f}' if isinstance(value, float) else str(value), className='font-mono'),
+        ], className='flex justify-between gap-4')
+        for key, value in details.items()
+    ], className='flex flex-col gap-1 text-sm')
+
+
+def create_section(title: str, entries: dict, ok_key: str, labels: tuple = None):
+    """Create a card listing checks or caches with their status."""
+    ok_label, failing_label = labels or (None, None)
+    return eui.Card(
+        className='w-full',
+        children=[
+            eui.CardHeader(children=[eui.CardTitle(children=title)]),
+            eui.CardContent(children=[
+                html.Div([
+                    html.Div([
+                        html.Div([
+                            html.Span(name, className='font-medium'),
+                            create_status_badge(details[ok_key], ok_label if details[ok_key] else failing_label),
+                        ], className='flex items-center justify-between'),
+                        create_detail_rows({key: value for key, value in details.items() if key != ok_key}),
+                    ], className='flex flex-col gap-2')
+                    for name, details in entries.items()
+                ] or [html.P('Nothing registered.', className='text-sm text-muted-foreground')],
+                    className='grid gap-6 md:grid-cols-2'),
+            ]),
+        ]
+    )
+
+
+layout = html.Div([
+    eui.PageHeader(
+        heading='System Health',
+        description=f'Readiness of this worker (JSON at {READY_PATH}, liveness at {LIVE_PATH}).',
+        className='p-6 border-b border-border bg-card',
+    ),
+    dcc.Interval(id='dev-health-interval', interval=REFRESH_INTERVAL * 1000),
+    html.Div(id='dev-health-report', className='flex flex-1 flex-col gap-4 p-6'),
+])
+
+
+@callback(
+    Output('dev-health-report', 'children'),
+    Input('dev-health-interval', 'n_intervals'),
+)
+def refresh_health(_n_intervals):
+    """Refresh the readiness report, thread saturation and cache state for this worker."""
+    ready, report = HEALTH.readiness()
+    saturation = report['saturation']
+    return [
+        eui.Card(
+            className='w-full',
+            children=[
+                eui.CardContent(className='pt-6', children=[
+                    html.Div([
+                        create_stat('Readiness', report['status'], ready),
+                        create_stat('Pages registered', report['pages'], report['pages_registered']),
+                        create_stat('Uptime', f'{report["uptime_s"] / 60:.0f} min'),
+                        create_stat('Worker PID', report['pid']),
+                        create_stat(
+                            'Threads in use',
+                            f'{saturation["in_flight"]} / {saturation["threads"]}',
+                            saturation['utilization'] < 1,
+                        ),
+                        create_stat('Oldest request', f'{saturation["oldest_request_s"]:.1f} s'),
+                    ], className='grid gap-4 md:grid-cols-3 lg:grid-cols-6'),
+                ]),
+            ]
+        ),
+        create_section('Dependencies', report['checks'], 'ok'),
+        create_section('Caches', report['caches'], 'warm', labels=('Warm', 'Cold')),
+    ]
@@ -0,0 +1,250 @@
+import datetime
+import json
+
+from dash import html, dcc, register_page, callback, Input, Output
+import emerald_ui_components as eui
+import plotly.graph_objects as go
+
+from metrics import CALLBACK_METRICS
+from profiler import PROFILE_STORE, icicle_data
+
+register_page(__name__, path='/dev/metrics', name='Raw Metrics')
+
+# Seconds between refreshes of the metrics table
+REFRESH_INTERVAL = 5
+
+COLUMNS = [
+    ('Callback', None),
+    ('Calls', 'count'),
+    ('Calls/min', 'rate_per_min'),
+    ('Errors', 'errors'),
+    ('Mean ms', 'mean_ms'),
+    ('p50 ms', 'p50_ms'),
+    ('p95 ms', 'p95_ms'),
+    ('p99 ms', 'p99_ms'),
+    ('Max ms', 'max_ms'),
+    ('Avg request', 'mean_request_bytes'),
+    ('Avg response', 'mean_response_bytes'),
+]
+
+
+def format_bytes(size: float) -> str:
+    """Format a byte count as B/KB/MB."""
+    for unit in ('B', 'KB'):
+        if size < 1024:
+            return f'{size:.0f} {unit}'
+        size /= 1024
+    return f'{size:.1f} MB'
+
+
+def format_cell(key: str, value) -> str:
+    """Format a metric value for the table."""
+    if key.endswith('_bytes'):
+        return format_bytes(value)
+    if isinstance(value, float):
+        return f'{value:.1f}'
+    return str(value)
+
+
+def create_metrics_table(callbacks: dict):
+    """Create the per-callback metrics table."""
+    header = html.Tr([
+        html.Th(title, className='px-3 py-2 text-left font-medium text-muted-foreground') for title, _ in COLUMNS
+    ], className='border-b')
+    rows = [
+        html.Tr([
+            html.Td(name, className='px-3 py-2 font-mono'),
+        ] + [
+            html.Td(
+                format_cell(key, stats[key]),
+                className='px-3 py-2 tabular-nums' + (' text-destructive' if key == 'errors' and stats[key] else ''),
+            )
+            for _, key in COLUMNS[1:]
+        ], className='border-b')
+        for name, stats in callbacks.items()
+    ]
+    if not rows:
+        rows = [html.Tr(html.Td(
+            'No callbacks recorded yet.',
+            colSpan=len(COLUMNS),
+            className='px-3 py-6 text-center text-muted-foreground',
+        ))]
+    return html.Table([html.Thead(header), html.Tbody(rows)], className='w-full text-sm')
+
+
+def create_latency_figure(callbacks: dict) -> go.Figure:
+    """Create a bar chart of p50/p95 latency for the busiest callbacks."""
+    names = list(callbacks)[:15]
+    figure = go.Figure([
+        go.Bar(name='p50', x=names, y=[callbacks[name]['p50_ms'] for name in names]),
+        go.Bar(name='p95', x=names, y=[callbacks[name]['p95_ms'] for name in names]),
+    ])
+    figure.update_layout(
+        barmode='group',
+        yaxis_title='ms',
+        margin=dict(l=40, r=10, t=10, b=40),
+        height=300,
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+    )
+    return figure
+
+
+def create_gauges(gauges: dict):
+    """Create a key/value list for each gauge group (e.g. the database pool)."""
+    if not gauges:
+        return [html.P('No gauges registered.', className='text-sm text-muted-foreground')]
+    return [
+        html.Div([
+            html.Span(name, className='font-medium'),
+            html.Dl([
+                html.Div([
+                    html.Dt(key, className='text-muted-foreground'),
+                    html.Dd(format_cell(key, value), className='font-mono'),
+                ], className='flex justify-between gap-4')
+                for key, value in values.items()
+            ], className='flex flex-col gap-1 text-sm'),
+        ], className='flex flex-col gap-2')
+        for name, values in gauges.items()
+    ]
+
+
+def create_flame_figure(profile: dict) -> go.Figure:
+    """Create an icicle (flame) chart of a profile's sampled stacks."""
+    figure = go.Figure(go.Icicle(
+        **icicle_data(profile),
+        branchvalues='total',
+        tiling=dict(orientation='v'),
+        hovertemplate='%{label}<br>%{value} samples (%{percentRoot:.1%})<extra></extra>',
+    ))
+    figure.update_layout(margin=dict(l=0, r=0, t=0, b=0), height=500, paper_bgcolor='rgba(0,0,0,0)')
+    return figure
+
+
+def profile_option(summary: dict) -> dict:
+    """Dropdown option for a stored profile."""
+    started = datetime.datetime.fromtimestamp(summary['started_at']).strftime('%Y-%m-%d %H:%M:%S')
+    label = f'{started} - {summary["callback"]} ({summary["duration_ms"]:.0f} ms, {summary["reason"]})'
+    return {'label': label, 'value': summary['id']}
+
+
+layout = html.Div([
+    eui.PageHeader(
+        heading='Raw Metrics',
+        description='Per-callback latency, payload size and error rates for this worker (JSON at /dev/metrics.json).',
+        className='p-6 border-b border-border bg-card',
+    ),
+    dcc.Interval(id='dev-metrics-interval', interval=REFRESH_INTERVAL * 1000),
+    html.Div([
+        eui.Card(
+            className='w-full',
+            children=[
+                eui.CardHeader(children=[
+                    eui.CardTitle(children='Callback Latency'),
+                    eui.CardDescription(id='dev-metrics-summary'),
+                ]),
+                eui.CardContent(children=[
+                    dcc.Graph(id='dev-metrics-latency', config={'displayModeBar': False}),
+                ]),
+            ]
+        ),
+        eui.Card(
+            className='w-full',
+            children=[
+                eui.CardHeader(children=[
+                    eui.CardTitle(children='Callbacks'),
+                ]),
+                eui.CardContent(children=[
+                    html.Div(id='dev-metrics-table', className='overflow-x-auto'),
+                ]),
+            ]
+        ),
+        eui.Card(
+            className='w-full',
+            children=[
+                eui.CardHeader(children=[
+                    eui.CardTitle(children='Gauges'),
+                ]),
+                eui.CardContent(children=[
+                    html.Div(id='dev-metrics-gauges', className='grid gap-6 md:grid-cols-2'),
+                ]),
+            ]
+        ),
+        eui.Card(
+            className='w-full',
+            children=[
+                eui.CardHeader(children=[
+                    eui.CardTitle(children='Callback Profiles'),
+                    eui.CardDescription(
+                        children='Sampled stacks of profiled callback requests (CALLBACK_PROFILER, PROFILE_CALLBACKS, '
+                        'PROFILE_SAMPLE_RATE or the profile request header).'
+                    ),
+                ]),
+                eui.CardContent(className='flex flex-col gap-4', children=[
+                    dcc.Dropdown(id='dev-profile-select', placeholder='Select a profile'),
+                    html.Div(id='dev-profile-view'),
+                ]),
+            ]
+        ),
+    ], className='flex flex-1 flex-col gap-4 p-6'),
+])
+
+
+@callback(
+    Output('dev-metrics-table', 'children'),
+    Output('dev-metrics-latency', 'figure'),
+    Output('dev-metrics-summary', 'children'),
+    Output('dev-metrics-gauges', 'children'),
+    Input('dev-metrics-interval', 'n_intervals'),
+)
+def refresh_metrics(_n_intervals):
+    """Refresh the callback table, latency chart, summary and gauges from this worker's metrics."""
+    snapshot = CALLBACK_METRICS.snapshot()
+    callbacks = snapshot['callbacks']
+    total = sum(stats['count'] for stats in callbacks.values())
+    errors = sum(stats['errors'] for stats in callbacks.values())
+    summary = f'{total} calls, {errors} errors over {snapshot["uptime_s"] / 60:.0f} min'
+    return (
+        create_metrics_table(callbacks),
+        create_latency_figure(callbacks),
+        summary,
+        create_gauges(snapshot['gauges']),
+    )
+
+
+@callback(
+    Output('dev-profile-select', 'options'),
+    Input('dev-metrics-interval', 'n_intervals'),
+)
+def refresh_profile_list(_n_intervals):
+    """Refresh the stored profiles in the profile picker, newest first."""
+    return [profile_option(summary) for summary in PROFILE_STORE.summaries()]
+
+
+@callback(
+    Output('dev-profile-view', 'children'),
+    Input('dev-profile-select', 'value'),
+)
+def show_profile(profile_id):
+    """Show the selected profile's details and flame graph."""
+    if not profile_id:
+        return html.P('No profile selected.', className='text-sm text-muted-foreground')
+    profile = PROFILE_STORE.load(profile_id)
+    if profile is None:
+        return html.P('This profile has been pruned.', className='text-sm text-muted-foreground')
+    if not profile['stacks']:
+        flame = html.P(
+            f'No samples - the callback finished within the {profile["interval_ms"]:g} ms sampling interval.',
+            className='text-sm text-muted-foreground',
+        )
+    else:
+        flame = dcc.Graph(figure=create_flame_figure(profile), config={'displayModeBar': False})
+    return html.Div([
+        html.P(
+            f'{profile["callback"]}: {profile["duration_ms"]:.1f} ms, {profile["samples"]} samples '
+            f'every {profile["interval_ms"]:g} ms',
+            className='text-sm',
+        ),
+        flame,
+        html.Pre(json.dumps(profile['inputs'], indent=2), className='max-h-80 overflow-auto rounded-md bg-muted p-4 text-xs'),
+    ], className='flex flex-col gap-4')
@@ -1,9 +1,13 @@
 from dash import html, register_page
 import emerald_ui_components as eui
 
+from components.icon import create_icon
+from render_cache import freeze_layout
+
 register_page(__name__, path='/settings/general', name='General')
 
-layout = html.Div([
+# Static page - built and serialized once, then served from cache
+layout = freeze_layout(html.Div([
     eui.PageHeader(
         heading='General Settings',
         description='Manage your general account settings and preferences.',
@@ -12,13 +16,13 @@ layout = html.Div([
             eui.Button(
                 variant='outline',
                 children=[
-                    eui.Icon(name='lucide:rotate-ccw', className='mr-2'),
+                    create_icon('lucide:rotate-ccw', className='mr-2'),
                     'Reset'
                 ]
             ),
             eui.Button(
                 children=[
-                    eui.Icon(name='lucide:save', className='mr-2'),
+                    create_icon('lucide:save', className='mr-2'),
                     'Save changes'
                 ]
             ),
@@ -55,4 +59,4 @@ layout = html.Div([
         ]
     ),
     ], className='p-6'),
-], className='flex flex-1 flex-col gap-4')
+], className='flex flex-1 flex-col gap-4'))
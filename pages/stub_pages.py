@@ -2,30 +2,29 @@
 from dash import html, register_page
 import emerald_ui_components as eui
 
-from navigation import PERSONA_NAVIGATION
+from components.icon import create_icon
+from navigation import NAV_INDEX
+from render_cache import freeze_layout
 
 # Pages that have real implementations (don't create stubs for these)
 EXISTING_PAGES = {
     '/',
     '/cluster/overview',
     '/settings/general',
+    '/dev/health',
+    '/dev/metrics',
 }
 
-# Collect all hrefs from navigation config
-NAV_HREFS = set()
-for nav_items in PERSONA_NAVIGATION.values():
-    for section in nav_items:
-        for item in section.get('items', []):
-            if 'href' in item:
-                NAV_HREFS.add(item['href'])
+# All hrefs from navigation config
+NAV_HREFS = NAV_INDEX.hrefs
 
 # Stub pages to create (nav hrefs minus existing pages)
 STUB_HREFS = NAV_HREFS - EXISTING_PAGES
 
 
 def create_stub_layout(href: str, title: str, description: str, icon: str):
-    """Create a stub layout function for a given page."""
-    def layout():
+    """Create a frozen stub layout for a given page (built once, on first visit)."""
+    def build_layout():
         return html.Div([
             eui.PageHeader(
                 heading=title,
@@ -40,7 +39,7 @@ def create_stub_layout(href: str, title: str, description: str, icon: str):
                             children=[
                                 html.Div([
                                     html.Div([
-                                        eui.LucideIcon(name=icon, className='size-8 text-muted-foreground'),
+                                        create_icon(icon, className='size-8 text-muted-foreground'),
                                     ], className='flex items-center justify-center size-16 rounded-full bg-muted mb-4'),
                                 ], className='flex items-center justify-center'),
                                 eui.CardTitle(children='Coming Soon'),
@@ -62,27 +61,22 @@ def create_stub_layout(href: str, title: str, description: str, icon: str):
                 ),
             ], className='flex flex-1 flex-col gap-4 p-6 items-center justify-center'),
         ])
-    return layout
+    return freeze_layout(build_layout)
 
 
 # Register stub pages for each missing nav item
-for nav_items in PERSONA_NAVIGATION.values():
-    for section in nav_items:
-        for item in section.get('items', []):
-            href = item.get('href')
-            if href and href in STUB_HREFS:
-                # Create unique module name from href
-                module_name = f"pages.stub_{href.replace('/', '_').strip('_')}"
-                register_page(
-                    module_name,
-                    path=href,
-                    name=item['title'],
-                    layout=create_stub_layout(
-                        href=href,
-                        title=item['title'],
-                        description=item.get('description', ''),
-                        icon=section.get('icon', 'File')
-                    )
-                )
-                # Remove from STUB_HREFS so we don't register duplicates
-                STUB_HREFS.discard(href)
+for href, page in NAV_INDEX.pages.items():
+    if href in STUB_HREFS:
+        # Create unique module name from href
+        module_name = f"pages.stub_{href.replace('/', '_').strip('_')}"
+        register_page(
+            module_name,
+            path=href,
+            name=page['title'],
+            layout=create_stub_layout(
+                href=href,
+                title=page['title'],
+                description=page['description'],
+                icon=page['icon']
+            )
+        )
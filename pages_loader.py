@@ -0,0 +1,117 @@
+# Page module discovery and registration (eager or lazy)
+import ast
+import importlib
+import os
+import threading
+from contextlib import contextmanager
+
+import dash
+from dash import page_registry, register_page
+
+from startup import StartupProfiler
+
+# Decorators/calls that register callbacks - modules using them must load at startup
+CALLBACK_NAMES = {'callback', 'clientside_callback'}
+
+_import_lock = threading.Lock()
+
+
+def discover_pages(pages_folder: str) -> list:
+    """Find page modules the same way Dash does, as (module name, file path) pairs."""
+    package = os.path.basename(os.path.normpath(pages_folder))
+    modules = []
+    for root, dirs, files in os.walk(pages_folder):
+        dirs[:] = sorted(d for d in dirs if not d.startswith('.') and not d.startswith('_'))
+        for file in sorted(files):
+            if file.startswith('_') or file.startswith('.') or not file.endswith('.py'):
+                continue
+            path = os.path.join(root, file)
+            with open(path, encoding='utf-8') as f:
+                if 'register_page' not in f.read():
+                    continue
+            relative = os.path.relpath(path, pages_folder)[:-len('.py')]
+            modules.append((f"{package}.{relative.replace(os.sep, '.')}", path))
+    return modules
+
+
+def read_page_metadata(path: str) -> dict:
+    """Get the register_page() kwargs of a page module without importing it.
+
+    Returns None if the module can't be registered lazily: it registers
+    callbacks, registers pages dynamically, or passes non-literal arguments.
+    """
+    with open(path, encoding='utf-8') as f:
+        tree = ast.parse(f.read(), filename=path)
+
+    registrations = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Name) and node.id in CALLBACK_NAMES:
+            return None
+        if isinstance(node, ast.Attribute) and node.attr in CALLBACK_NAMES:
+            return None
+        if isinstance(node, ast.Call) and getattr(node.func, 'id', None) == 'register_page':
+            registrations.append(node)
+
+    if len(registrations) != 1:
+        return None
+    call = registrations[0]
+    if len(call.args) != 1 or getattr(call.args[0], 'id', None) != '__name__':
+        return None
+
+    try:
+        kwargs = {kw.arg: ast.literal_eval(kw.value) for kw in call.keywords}
+    except ValueError:
+        return None
+    if None in kwargs or 'layout' in kwargs:
+        return None
+    return kwargs
+
+
+def import_page(module_name: str):
+    """Import a page module and attach its module-level layout to the registry."""
+    module = importlib.import_module(module_name)
+    page = page_registry.get(module_name)
+    if page is not None and not page.get('supplied_layout'):
+        page['layout'] = getattr(module, 'layout')
+    return module
+
+
+@contextmanager
+def skip_register_page():
+    """Make dash.register_page() a no-op while a lazily registered page module is imported."""
+    original = dash.register_page
+    dash.register_page = lambda *args, **kwargs: None
+    try:
+        yield
+    finally:
+        dash.register_page = original
+
+
+def create_lazy_layout(module_name: str):
+    """Create a layout function that imports its page module on first request."""
+    def lazy_layout(**kwargs):
+        with _import_lock:
+            page = page_registry[module_name]
+            if page['layout'] is lazy_layout:
+                # The module's own register_page() runs inside a callback here,
+                # where Dash forbids it - the placeholder entry already covers it
+                with skip_register_page():
+                    module = importlib.import_module(module_name)
+                page['layout'] = getattr(module, 'layout')
+        layout = page_registry[module_name]['layout']
+        return layout(**kwargs) if callable(layout) else layout
+    return lazy_layout
+
+
+def load_pages(pages_folder: str, lazy: bool = False, profiler: StartupProfiler = None):
+    """Register every page module, deferring imports where possible when lazy."""
+    profiler = profiler or StartupProfiler(enabled=False)
+    for module_name, path in discover_pages(pages_folder):
+        metadata = read_page_metadata(path) if lazy else None
+        if metadata is None:
+            with profiler.phase(f'import {module_name}'):
+                import_page(module_name)
+        else:
+            with profiler.phase(f'register {module_name} (lazy)'):
+                register_page(module_name, layout=None, **metadata)
+                page_registry[module_name]['layout'] = create_lazy_layout(module_name)
@@ -0,0 +1,217 @@
+# Opt-in sampling profiler for Dash callbacks, with profiles stored for the /dev/metrics viewer
+import json
+import logging
+import os
+import random
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+
+from flask import request
+
+from config import (
+    PROFILE_CALLBACKS, PROFILE_SAMPLE_RATE, PROFILE_HEADER, PROFILE_INTERVAL_MS, PROFILE_DIR, PROFILE_STORE_SIZE,
+)
+from metrics import callback_name, is_background_callback
+
+logger = logging.getLogger(__name__)
+
+# Stored callback inputs are truncated beyond this many characters of JSON
+MAX_INPUTS_CHARS = 20000
+
+# Deepest stack recorded per sample
+MAX_STACK_DEPTH = 200
+
+# Fields shown in the profile list
+SUMMARY_KEYS = ('id', 'callback', 'started_at', 'duration_ms', 'reason', 'samples')
+
+
+def frame_label(code) -> str:
+    """Name a stack frame as 'function (file.py:line)'."""
+    return f'{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})'
+
+
+class StackSampler:
+    """Samples one thread's Python stack at a fixed interval from a background thread.
+
+    Only the frames below stop_code (profile_call) are kept, so stacks
+    start at the callback dispatch rather than the WSGI server.
+    """
+
+    def __init__(self, thread_id: int, stop_code, interval: float):
+        self.thread_id = thread_id
+        self.stop_code = stop_code
+        self.interval = interval
+        self.stacks = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='callback-profiler', daemon=True)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None and len(stack) < MAX_STACK_DEPTH:
+                stack.append(frame_label(frame.f_code))
+                if frame.f_code is self.stop_code:
+                    break
+                frame = frame.f_back
+            if stack:
+                self.stacks[tuple(reversed(stack))] += 1
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self) -> Counter:
+        """Stop sampling and return {stack tuple: sample count}."""
+        self._stop.set()
+        self._thread.join()
+        return self.stacks
+
+
+class ProfileStore:
+    """Profiles saved as JSON files, shared by all workers; only the newest are kept."""
+
+    def __init__(self, directory: str = PROFILE_DIR, max_profiles: int = PROFILE_STORE_SIZE):
+        self.directory = directory
+        self.max_profiles = max_profiles
+
+    def save(self, profile: dict):
+        """Write a profile and prune the oldest beyond max_profiles."""
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(self.directory, f'{profile["id"]}.json')
+        with open(path + '.tmp', 'w') as f:
+            json.dump(profile, f)
+        os.replace(path + '.tmp', path)
+        for old_path in self.paths()[self.max_profiles:]:
+            try:
+                os.remove(old_path)
+            except FileNotFoundError:
+                pass
+
+    def paths(self) -> list:
+        """Get stored profile files, newest first."""
+        try:
+            entries = [entry for entry in os.scandir(self.directory) if entry.name.endswith('.json')]
+        except FileNotFoundError:
+            return []
+        mtimes = []
+        for entry in entries:
+            try:
+                mtimes.append((entry.stat().st_mtime, entry.path))
+            except FileNotFoundError:
+                # Pruned by another worker since the scan
+                continue
+        mtimes.sort(reverse=True)
+        return [path for _, path in mtimes]
+
+    def summaries(self) -> list:
+        """Get profile summaries (without stacks and inputs), newest first."""
+        summaries = []
+        for path in self.paths():
+            profile = self.load(os.path.basename(path)[:-len('.json')])
+            if profile is not None:
+                summaries.append({key: profile[key] for key in SUMMARY_KEYS})
+        return summaries
+
+    def load(self, profile_id: str) -> dict:
+        """Load a stored profile, or None if it has been pruned."""
+        try:
+            with open(os.path.join(self.directory, f'{os.path.basename(profile_id)}.json')) as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+
+PROFILE_STORE = ProfileStore()
+
+
+def profile_reason(name: str, headers=None) -> str:
+    """Why this call should be profiled, or None: listed callback, header or random sample.
+
+    Background jobs have no request, so only the listed callbacks and sampling apply to them.
+    """
+    if name in PROFILE_CALLBACKS:
+        return 'callback'
+    if PROFILE_HEADER and headers is not None and headers.get(PROFILE_HEADER):
+        return 'header'
+    if PROFILE_SAMPLE_RATE and random.random() < PROFILE_SAMPLE_RATE:
+        return 'sample'
+    return None
+
+
+def truncated_inputs(body: dict):
+    """Get a callback's inputs and state for storage, truncated if very large."""
+    inputs = {'inputs': body.get('inputs'), 'state': body.get('state')}
+    text = json.dumps(inputs, default=str)
+    if len(text) > MAX_INPUTS_CHARS:
+        return {'truncated': text[:MAX_INPUTS_CHARS]}
+    # Round-trip so values JSON can't store (e.g. a background job's set_progress) become strings
+    return json.loads(text)
+
+
+def profile_call(name: str, reason: str, body: dict, call, store: ProfileStore = PROFILE_STORE):
+    """Run call() with its thread's stack sampled, store the profile and return call()'s result."""
+    sampler = StackSampler(threading.get_ident(), profile_call.__code__, PROFILE_INTERVAL_MS / 1000)
+    started_at = time.time()
+    start = time.perf_counter()
+    sampler.start()
+    try:
+        return call()
+    finally:
+        stacks = sampler.stop()
+        try:
+            store.save({
+                'id': uuid.uuid4().hex[:12],
+                'callback': name,
+                'started_at': started_at,
+                'duration_ms': (time.perf_counter() - start) * 1000,
+                'reason': reason,
+                'interval_ms': PROFILE_INTERVAL_MS,
+                'samples': sum(stacks.values()),
+                'inputs': truncated_inputs(body),
+                'stacks': [[list(stack), count] for stack, count in stacks.most_common()],
+            })
+        except OSError as e:
+            logger.warning('Could not save callback profile for %s: %s', name, e)
+
+
+def init_callback_profiler(app, store: ProfileStore = PROFILE_STORE) -> ProfileStore:
+    """Wrap Dash's callback dispatch so selected requests are profiled.
+
+    Background callbacks are skipped here: their requests only submit and poll
+    the job, which profiles itself (see background.instrument_job).
+    """
+    endpoint = app.config.routes_pathname_prefix + '_dash-update-component'
+    view = app.server.view_functions[endpoint]
+
+    def profiled_view(*args, **kwargs):
+        body = request.get_json(silent=True) or {}
+        output = body.get('output', '')
+        if is_background_callback(app, output):
+            return view(*args, **kwargs)
+        name = callback_name(app, output)
+        reason = profile_reason(name, request.headers)
+        if reason is None:
+            return view(*args, **kwargs)
+        return profile_call(name, reason, body, lambda: view(*args, **kwargs), store)
+
+    profiled_view.__name__ = getattr(view, '__name__', 'profiled_view')
+    app.server.view_functions[endpoint] = profiled_view
+    return store
+
+
+def icicle_data(profile: dict) -> dict:
+    """Fold a profile's stacks into plotly icicle ids/labels/parents/values."""
+    values = Counter()
+    for stack, count in profile['stacks']:
+        for depth in range(1, len(stack) + 1):
+            values[tuple(stack[:depth])] += count
+    paths = sorted(values)
+    return {
+        'ids': [';'.join(path) for path in paths],
+        'labels': [path[-1] for path in paths],
+        'parents': [';'.join(path[:-1]) for path in paths],
+        'values': [values[path] for path in paths],
+    }
@@ -0,0 +1,188 @@
+# Query-result cache shared by all workers (SQLite file) with TTLs and namespace invalidation
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from config import QUERY_CACHE, QUERY_CACHE_PATH, QUERY_CACHE_TTL, QUERY_CACHE_SIZE
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS generations (
+    namespace TEXT PRIMARY KEY,
+    generation INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS entries (
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    generation INTEGER NOT NULL,
+    expires REAL NOT NULL,
+    value TEXT NOT NULL,
+    PRIMARY KEY (namespace, key)
+);
+CREATE INDEX IF NOT EXISTS entries_expires ON entries (expires);
+'''
+
+# Writes between checks of the entry limit
+PRUNE_EVERY = 64
+
+
+class QueryCache:
+    """JSON query results in a SQLite file, so every worker shares one cache.
+
+    Each namespace has a generation: invalidate() bumps it, which retires the
+    namespace's entries for all workers at once (including results that were
+    being computed when the data changed). Entries also expire after their TTL.
+    Cache errors never fail a lookup - the result is computed instead.
+    """
+
+    def __init__(self, path: str = QUERY_CACHE_PATH, ttl: float = QUERY_CACHE_TTL,
+                 max_entries: int = QUERY_CACHE_SIZE, enabled: bool = QUERY_CACHE):
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.errors = 0
+        self._writes = 0
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def _connection(self) -> sqlite3.Connection:
+        """Get this thread's connection (a new one after fork)."""
+        connection = getattr(self._local, 'connection', None)
+        if connection is None or self._local.pid != os.getpid():
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            connection = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=NORMAL')
+            connection.executescript(SCHEMA)
+            self._local.connection, self._local.pid = connection, os.getpid()
+        return connection
+
+    def _count(self, counter: str):
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def _generation(self, db: sqlite3.Connection, namespace: str) -> int:
+        db.execute('INSERT OR IGNORE INTO generations VALUES (?, 0)', (namespace,))
+        return db.execute('SELECT generation FROM generations WHERE namespace = ?', (namespace,)).fetchone()[0]
+
+    def get_or_create(self, namespace: str, key: str, factory, ttl: float = None):
+        """Return the cached result for key, computing and storing factory() on a miss."""
+        if not self.enabled:
+            return factory()
+
+        try:
+            db = self._connection()
+            generation = self._generation(db, namespace)
+            row = db.execute(
+                'SELECT value FROM entries WHERE namespace = ? AND key = ? AND generation = ? AND expires > ?',
+                (namespace, key, generation, time.time()),
+            ).fetchone()
+        except sqlite3.Error:
+            self._count('errors')
+            return factory()
+        if row is not None:
+            self._count('hits')
+            return json.loads(row[0])
+        self._count('misses')
+
+        value = factory()
+        try:
+            db.execute(
+                'INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?)',
+                (namespace, key, generation, time.time() + (self.ttl if ttl is None else ttl), json.dumps(value)),
+            )
+            self._prune(db)
+        except sqlite3.Error:
+            self._count('errors')
+        return value
+
+    def _prune(self, db: sqlite3.Connection):
+        """Every PRUNE_EVERY writes, drop expired entries and the soonest-expiring beyond max_entries."""
+        with self._lock:
+            self._writes += 1
+            if self._writes % PRUNE_EVERY:
+                return
+        db.execute('DELETE FROM entries WHERE expires <= ?', (time.time(),))
+        db.execute(
+            'DELETE FROM entries WHERE rowid IN (SELECT rowid FROM entries ORDER BY expires DESC LIMIT -1 OFFSET ?)',
+            (self.max_entries,),
+        )
+
+    def invalidate(self, namespace: str):
+        """Retire every cached result in a namespace, for all workers."""
+        self._count('invalidations')
+        try:
+            db = self._connection()
+            self._generation(db, namespace)
+            db.execute('UPDATE generations SET generation = generation + 1 WHERE namespace = ?', (namespace,))
+            db.execute(
+                'DELETE FROM entries WHERE namespace = ? AND generation < '
+                '(SELECT generation FROM generations WHERE namespace = ?)',
+                (namespace, namespace),
+            )
+        except sqlite3.Error:
+            self._count('errors')
+
+    def stats(self) -> dict:
+        """Get the shared entry count and this worker's hit/miss counters."""
+        try:
+            size = self._connection().execute('SELECT COUNT(*) FROM entries').fetchone()[0] if self.enabled else 0
+        except sqlite3.Error:
+            size = None
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': size,
+                'maxsize': self.max_entries,
+                'ttl_s': self.ttl,
+                'hits': self.hits,
+                'misses': self.misses,
+                'invalidations': self.invalidations,
+                'errors': self.errors,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+            }
+
+
+QUERY_CACHE = QueryCache()
+
+
+def invalidate_on_commit(model, namespace: str, cache: QueryCache = QUERY_CACHE):
+    """Invalidate namespace whenever a session in this process commits writes to model's rows.
+
+    Only writes made by the process that calls this are seen: the writer
+    (e.g. the service that stores PowerTargets) must call it at startup.
+    Otherwise cached results refresh when their TTL runs out, or when
+    'python query_cache.py invalidate <namespace>' is run.
+    """
+    def note_writes(session, _flush_context):
+        if any(isinstance(obj, model) for obj in (*session.new, *session.dirty, *session.deleted)):
+            session.info.setdefault('query_cache_writes', set()).add(namespace)
+
+    def invalidate(session):
+        if namespace in session.info.get('query_cache_writes', ()):
+            session.info['query_cache_writes'].discard(namespace)
+            cache.invalidate(namespace)
+
+    def forget_writes(session):
+        session.info.get('query_cache_writes', set()).discard(namespace)
+
+    event.listen(Session, 'after_flush', note_writes)
+    event.listen(Session, 'after_commit', invalidate)
+    event.listen(Session, 'after_rollback', forget_writes)
+
+
+if __name__ == '__main__':
+    # python query_cache.py invalidate <namespace> - e.g. from a job that writes the source tables
+    if len(sys.argv) != 3 or sys.argv[1] != 'invalidate':
+        sys.exit('usage: python query_cache.py invalidate <namespace>')
+    QUERY_CACHE.invalidate(sys.argv[2])
+    print(f'Invalidated {sys.argv[2]}')
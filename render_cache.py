@@ -0,0 +1,88 @@
+# Render caching helpers for component trees
+import json
+import threading
+from collections import OrderedDict
+
+from plotly.io.json import to_json_plotly
+
+
+def serialize_component(component):
+    """Serialize a component tree to plain JSON-ready dicts.
+
+    Dash sends plain dicts in the same {type, namespace, props} shape as
+    components, so cached trees skip the component-by-component encoding.
+    """
+    return json.loads(to_json_plotly(component))
+
+
+def freeze_layout(layout):
+    """Freeze a static page layout so it's built and serialized only once.
+
+    Accepts a component tree or a zero-argument builder and returns a layout
+    function for register_page that serves the cached, pre-serialized payload.
+    """
+    payload = None
+    lock = threading.Lock()
+
+    def frozen_layout(**_kwargs):
+        nonlocal payload
+        if payload is None:
+            with lock:
+                if payload is None:
+                    payload = serialize_component(layout() if callable(layout) else layout)
+        return payload
+
+    return frozen_layout
+
+
+class LRUCache:
+    """Thread-safe bounded LRU cache with hit/miss counters."""
+
+    def __init__(self, maxsize: int = 128):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._data)
+
+    def get_or_create(self, key, factory):
+        """Return the cached value for key, building it with factory() on a miss."""
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return self._data[key]
+            self.misses += 1
+
+        # Build outside the lock so slow renders don't serialize all workers' threads
+        value = factory()
+
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+        return value
+
+    def clear(self):
+        """Drop all cached entries (counters are kept)."""
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> dict:
+        """Get cache size and hit/miss counters."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self._data),
+                'maxsize': self.maxsize,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+            }
@@ -0,0 +1,143 @@
+# Server-rendered app shell injected into index_template.html
+#
+# Dash only paints the sidebar and header after fetching the layout and
+# dependencies and mounting the React tree. The shell is a static HTML copy of
+# that chrome (logos, default persona's nav, header) rendered once at startup,
+# shown immediately, and removed as soon as the real sidebar has mounted.
+from html import escape
+
+from components.header import CURRENT_USER
+from navigation import DEFAULT_PERSONA, NAV_INDEX
+from static_assets import asset_url, has_built_assets
+
+LOGO_LIGHT = 'images/emerald-logo-full.svg'
+LOGO_DARK = 'images/emerald-logo-full-reversed.svg'
+
+# Seconds before the shell is removed even if Dash never mounts (e.g. a bundle failed to load)
+SHELL_TIMEOUT = 15
+
+# The stored theme ('light'/'dark', resolving 'system' from the OS preference)
+RESOLVE_THEME_JS = """var theme = localStorage.getItem('emerald-ui-theme') || 'system';
+        if (theme === 'system') {
+            theme = window.matchMedia('(prefers-color-scheme: dark)').matches ? 'dark' : 'light';
+        }"""
+
+# Apply the stored theme before first paint so the shell matches the app
+THEME_SCRIPT = f'''<script>
+    (function () {{
+        {RESOLVE_THEME_JS}
+        document.documentElement.classList.add(theme);
+    }})();
+</script>'''
+
+# Swap the shell out once Dash has mounted the real sidebar menu, or after
+# SHELL_TIMEOUT so a failed load never leaves the page covered
+HYDRATE_SCRIPT = f'''<script>
+    (function () {{
+        function mounted() {{
+            var menu = document.getElementById('sidebar-nav-menu');
+            return menu && menu.children.length > 0;
+        }}
+        function removeShell() {{
+            var shell = document.getElementById('app-shell');
+            if (shell) shell.remove();
+        }}
+        if (mounted()) return removeShell();
+        var observer = new MutationObserver(function () {{
+            if (mounted()) {{
+                observer.disconnect();
+                removeShell();
+            }}
+        }});
+        observer.observe(document.getElementById('react-entry-point') || document.body, {{
+            childList: true,
+            subtree: true,
+        }});
+        setTimeout(function () {{
+            observer.disconnect();
+            removeShell();
+        }}, {SHELL_TIMEOUT * 1000});
+    }})();
+</script>'''
+
+
+def render_logo_preload() -> str:
+    """Preload only the logo for the active theme (known only in the browser)."""
+    return f'''<script>
+        (function () {{
+            {RESOLVE_THEME_JS}
+            var link = document.createElement('link');
+            link.rel = 'preload';
+            link.as = 'image';
+            link.href = theme === 'dark' ? '{asset_url(LOGO_DARK)}' : '{asset_url(LOGO_LIGHT)}';
+            document.head.appendChild(link);
+        }})();
+    </script>'''
+
+
+def render_preload_hints() -> str:
+    """Preload the stylesheet and the above-the-fold logo so they're fetched before the renderer."""
+    hints = []
+    if has_built_assets():
+        hints.append(f'<link rel="preload" as="style" href="{asset_url("app.css")}">')
+    hints.append(render_logo_preload())
+    return '\n    '.join(hints)
+
+
+def render_nav_html(persona_key: str) -> str:
+    """Render a persona's navigation sections as static links."""
+    sections = []
+    for section in NAV_INDEX.navigation(persona_key):
+        links = ''.join(
+            f'<li><a href="{escape(item["href"])}" class="flex h-7 items-center rounded-md px-2 text-sm '
+            f'text-sidebar-foreground hover:bg-sidebar-accent">{escape(item["title"])}</a></li>'
+            for item in section.get('items', []) if 'href' in item
+        )
+        sections.append(
+            f'<li><div class="flex h-8 items-center px-2 text-sm font-medium">{escape(section["title"])}</div>'
+            f'<ul class="ml-3.5 flex flex-col gap-1 border-l px-2.5 py-0.5">{links}</ul></li>'
+        )
+    return f'<ul class="flex flex-col gap-1">{"".join(sections)}</ul>'
+
+
+def render_shell_html(persona=None) -> str:
+    """Render the static sidebar and header shell for a persona."""
+    persona = persona or DEFAULT_PERSONA
+    return f'''<div id="app-shell" class="fixed inset-0 flex bg-background text-foreground" style="z-index: 10001;">
+    <aside class="hidden w-64 shrink-0 flex-col border-r bg-sidebar text-sidebar-foreground md:flex">
+        <div class="flex h-16 items-center justify-center border-b bg-card">
+            <img src="{asset_url(LOGO_LIGHT)}" class="h-8 logo-light" alt="Emerald AI">
+            <img src="{asset_url(LOGO_DARK)}" class="h-8 logo-dark" alt="Emerald AI">
+        </div>
+        <nav class="flex-1 overflow-auto p-2">
+            <div class="flex h-8 items-center px-2 text-xs font-medium text-sidebar-foreground/70">Platform</div>
+            {render_nav_html(persona['key'])}
+        </nav>
+        <div class="flex items-center gap-2 p-4">
+            <div class="flex size-8 items-center justify-center rounded-lg bg-muted">
+                <div class="size-3 rounded-full {escape(persona['color'])}"></div>
+            </div>
+            <div class="grid flex-1 text-left text-sm leading-tight">
+                <span class="truncate font-medium">{escape(persona['name'])}</span>
+                <span class="truncate text-xs text-muted-foreground">{escape(persona['description'])}</span>
+            </div>
+        </div>
+    </aside>
+    <div class="flex flex-1 flex-col">
+        <header class="flex h-16 shrink-0 items-center gap-2 border-b bg-card px-4">
+            <div class="ml-auto flex size-6 items-center justify-center rounded-full bg-muted text-xs">{escape(CURRENT_USER['initials'])}</div>
+        </header>
+        <main class="flex-1"></main>
+    </div>
+</div>
+{HYDRATE_SCRIPT}'''
+
+
+def inject_shell(index_string: str, enabled: bool) -> str:
+    """Fill the {%preload_hints%} and {%app_shell%} placeholders of the index template."""
+    index_string = index_string.replace('{%preload_hints%}', render_preload_hints())
+    if not enabled:
+        return index_string.replace('{%app_shell%}', '')
+    # The shell replaces the full-screen loader
+    shell = f'{THEME_SCRIPT}\n<style>#initial-loader {{ display: none; }}</style>\n{render_shell_html()}'
+    return index_string.replace('{%app_shell%}', shell)
@@ -0,0 +1,40 @@
+# Startup-time profiling for app boot
+import time
+from contextlib import contextmanager
+
+
+class StartupProfiler:
+    """Records how long each startup phase (imports, page registration) takes."""
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self.phases = []  # (name, seconds)
+        self._started = time.perf_counter()
+
+    @contextmanager
+    def phase(self, name: str):
+        """Time the wrapped block as a named startup phase."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append((name, time.perf_counter() - start))
+
+    @property
+    def total(self) -> float:
+        """Seconds since the profiler was created."""
+        return time.perf_counter() - self._started
+
+    def report(self) -> str:
+        """Format the recorded phases, slowest first, as a text table."""
+        width = max([len(name) for name, _ in self.phases] + [len('total')])
+        lines = ['Startup profile:']
+        for name, seconds in sorted(self.phases, key=lambda p: p[1], reverse=True):
+            lines.append(f'  {name:<{width}}  {seconds * 1000:8.1f} ms')
+        lines.append(f'  {"total":<{width}}  {self.total * 1000:8.1f} ms')
+        return '\n'.join(lines)
+
+    def print_report(self):
+        """Print the report if profiling is enabled."""
+        if self.enabled:
+            print(self.report(), flush=True)
@@ -0,0 +1,74 @@
+# Built (hashed, precompressed) static assets - see build_assets.py
+import json
+import mimetypes
+import os
+
+from flask import abort, request, send_file
+
+from config import ASSET_BUILD_DIR, ASSET_URL_PREFIX
+
+MANIFEST_FILE = 'manifest.json'
+
+# Long-lived caching is safe because every built file name contains its content hash
+IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+
+# Precompressed variants, in order of preference
+ENCODINGS = [('br', '.br'), ('gzip', '.gz')]
+
+
+def load_manifest(build_dir: str = ASSET_BUILD_DIR) -> dict:
+    """Load the logical name -> hashed file name manifest, or {} if assets aren't built."""
+    try:
+        with open(os.path.join(build_dir, MANIFEST_FILE)) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+MANIFEST = load_manifest()
+
+
+def has_built_assets() -> bool:
+    """Whether build_assets.py compiled the stylesheet for this deploy (otherwise Tailwind comes from the CDN)."""
+    return 'app.css' in MANIFEST
+
+
+def asset_url(name: str) -> str:
+    """Get the URL for an asset, preferring its hashed build over the raw assets/ file."""
+    if name in MANIFEST:
+        return f'{ASSET_URL_PREFIX}/{MANIFEST[name]}'
+    return f'/assets/{name}'
+
+
+def serve_built_asset(filename: str):
+    """Serve a built asset, picking a precompressed variant the client accepts."""
+    build_dir = os.path.abspath(ASSET_BUILD_DIR)
+    path = os.path.abspath(os.path.join(build_dir, filename))
+    if not path.startswith(build_dir + os.sep) or not os.path.isfile(path):
+        abort(404)
+
+    mimetype = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+    accepted = request.headers.get('Accept-Encoding', '')
+    encoding = None
+    for name, suffix in ENCODINGS:
+        if name in accepted and os.path.isfile(path + suffix):
+            path, encoding = path + suffix, name
+            break
+
+    response = send_file(
+        path, mimetype=mimetype, download_name=os.path.basename(filename), conditional=True, etag=True
+    )
+    if encoding:
+        response.headers['Content-Encoding'] = encoding
+    response.headers['Cache-Control'] = IMMUTABLE_CACHE_CONTROL
+    response.headers['Vary'] = 'Accept-Encoding'
+    return response
+
+
+def register_static_assets(server):
+    """Add the route serving built assets to the Flask server."""
+    server.add_url_rule(
+        f'{ASSET_URL_PREFIX}/<path:filename>',
+        endpoint='built_asset',
+        view_func=serve_built_asset,
+    )
@@ -0,0 +1,136 @@
+# Latest-request-wins tracking shared by all workers, so superseded callback work stops early
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+
+from config import CANCEL_SUPERSEDED, SUPERSEDE_PATH, SUPERSEDE_POLL_MS
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS latest (
+    key TEXT PRIMARY KEY,
+    token TEXT NOT NULL,
+    started REAL NOT NULL
+);
+'''
+
+# Keys untouched for this long (closed tabs) are deleted
+STALE_AFTER_S = 24 * 3600
+
+
+class SupersededError(Exception):
+    """A newer request for the same key started; this one's result would be discarded."""
+
+
+class LatestRequests:
+    """Records the newest request token per key (e.g. browser tab + callback) in a SQLite file.
+
+    The renderer already ignores responses to superseded callback requests,
+    but the server still runs them. Callbacks call begin() on entry, check()
+    between expensive steps and wrap database queries in cancel_superseded()
+    so a request that a newer one replaced stops instead of finishing its queries.
+    Store errors never fail a request - it just isn't cancelled.
+    """
+
+    def __init__(self, path: str = SUPERSEDE_PATH, poll_ms: float = SUPERSEDE_POLL_MS,
+                 enabled: bool = CANCEL_SUPERSEDED):
+        self.path = path
+        self.poll_interval = poll_ms / 1000
+        self.enabled = enabled
+        self.superseded = 0
+        self.cancelled_queries = 0
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def _connection(self) -> sqlite3.Connection:
+        """Get this thread's connection (a new one after fork)."""
+        connection = getattr(self._local, 'connection', None)
+        if connection is None or self._local.pid != os.getpid():
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            connection = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.executescript(SCHEMA)
+            connection.execute('DELETE FROM latest WHERE started < ?', (time.time() - STALE_AFTER_S,))
+            self._local.connection, self._local.pid = connection, os.getpid()
+        return connection
+
+    def begin(self, key: str) -> str:
+        """Make a new request the latest for key; returns its token."""
+        token = uuid.uuid4().hex
+        if self.enabled and key:
+            try:
+                self._connection().execute(
+                    'INSERT OR REPLACE INTO latest VALUES (?, ?, ?)', (key, token, time.time()),
+                )
+            except sqlite3.Error:
+                pass
+        return token
+
+    def is_current(self, key: str, token: str) -> bool:
+        """Whether token is still the latest request for key."""
+        if not self.enabled or not key:
+            return True
+        try:
+            row = self._connection().execute('SELECT token FROM latest WHERE key = ?', (key,)).fetchone()
+        except sqlite3.Error:
+            return True
+        return row is None or row[0] == token
+
+    def check(self, key: str, token: str):
+        """Raise SupersededError if a newer request for key has started."""
+        if not self.is_current(key, token):
+            with self._lock:
+                self.superseded += 1
+            raise SupersededError(key)
+
+    @contextmanager
+    def cancel_superseded(self, key: str, token: str, connection):
+        """Cancel the statement running on a SQLAlchemy connection if the request is superseded.
+
+        A watcher thread polls the latest token and asks the driver to cancel
+        (psycopg's cancel(), sqlite3's interrupt()); the query then fails and
+        SupersededError is raised in its place.
+        """
+        if not self.enabled or not key:
+            yield
+            return
+
+        driver_connection = connection.connection.driver_connection
+        cancel = getattr(driver_connection, 'cancel', None) or getattr(driver_connection, 'interrupt', None)
+        done = threading.Event()
+        cancelled = threading.Event()
+
+        def watch():
+            while not done.wait(self.poll_interval):
+                if not self.is_current(key, token):
+                    cancelled.set()
+                    if cancel is not None:
+                        cancel()
+                    return
+
+        watcher = threading.Thread(target=watch, name='supersede-watch', daemon=True)
+        watcher.start()
+        try:
+            yield
+        except Exception:
+            if cancelled.is_set():
+                with self._lock:
+                    self.cancelled_queries += 1
+                raise SupersededError(key)
+            raise
+        finally:
+            done.set()
+            watcher.join()
+        if cancelled.is_set():
+            # The query finished before the cancel landed - the result is still stale
+            self.check(key, token)
+
+    def stats(self) -> dict:
+        """Get this worker's superseded request counters."""
+        with self._lock:
+            return {'superseded': self.superseded, 'cancelled_queries': self.cancelled_queries}
+
+
+LATEST_REQUESTS = LatestRequests()
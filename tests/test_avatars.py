@@ -0,0 +1,73 @@
+# Avatar proxy tests against a local stand-in source (no network)
+import threading
+import time
+
+import pytest
+from flask import Flask
+from PIL import Image
+
+import avatars
+
+
+@pytest.fixture
+def avatar_env(tmp_path, monkeypatch):
+    """Point the proxy at a temp cache dir and a 120x80 PNG on disk."""
+    source = tmp_path / 'source.png'
+    Image.new('RGB', (120, 80), 'green').save(source)
+    monkeypatch.setattr(avatars, 'AVATAR_CACHE_DIR', str(tmp_path / 'cache'))
+    monkeypatch.setattr(avatars, 'AVATAR_SOURCES', {'someone': f'file://{source}'})
+    monkeypatch.setattr(avatars, '_failures', {})
+
+    server = Flask(__name__)
+    avatars.register_avatar_routes(server)
+    return server.test_client(), tmp_path
+
+
+def test_serves_square_resized_avatar(avatar_env):
+    client, _ = avatar_env
+    response = client.get(avatars.avatar_url('someone'))
+    assert response.status_code == 200
+    assert response.mimetype == 'image/png'
+    with Image.open(avatars.avatar_path('someone', 48)) as image:
+        assert image.size == (48, 48)
+
+
+def test_unknown_user_or_size_is_404(avatar_env):
+    client, _ = avatar_env
+    assert client.get(avatars.avatar_url('nobody')).status_code == 404
+    assert client.get('/avatars/someone/24.png').status_code == 404
+
+
+def test_failing_source_is_not_retried_immediately(avatar_env, monkeypatch):
+    client, tmp_path = avatar_env
+    monkeypatch.setattr(avatars, 'AVATAR_SOURCES', {'someone': str(tmp_path / 'missing.png')})
+    assert client.get(avatars.avatar_url('someone')).status_code == 404
+    assert 'someone' in avatars._failures
+
+    # Even once the source exists, the retry waits for RETRY_AFTER
+    Image.new('RGB', (10, 10)).save(tmp_path / 'missing.png')
+    assert client.get(avatars.avatar_url('someone')).status_code == 404
+
+
+def test_slow_source_only_blocks_its_own_user(avatar_env, monkeypatch):
+    _, tmp_path = avatar_env
+    monkeypatch.setitem(avatars.AVATAR_SOURCES, 'slow', 'slow-source')
+    real_read_source = avatars.read_source
+    release = threading.Event()
+
+    def read_source(source):
+        if source == 'slow-source':
+            release.wait(5)
+            raise OSError('upstream timed out')
+        return real_read_source(source)
+
+    monkeypatch.setattr(avatars, 'read_source', read_source)
+    slow = threading.Thread(target=avatars.ensure_avatar, args=('slow', 48))
+    slow.start()
+    try:
+        start = time.perf_counter()
+        assert avatars.ensure_avatar('someone', 48)
+        assert time.perf_counter() - start < 2
+    finally:
+        release.set()
+        slow.join()
@@ -0,0 +1,31 @@
+# Background job instrumentation tests on a temp disk cache
+import diskcache
+import pytest
+from dash.exceptions import PreventUpdate
+
+import background
+
+
+@pytest.fixture
+def job_cache(tmp_path, monkeypatch):
+    cache = diskcache.Cache(str(tmp_path / 'background'))
+    monkeypatch.setattr(background, 'BACKGROUND_CACHE', cache)
+    return cache
+
+
+def test_job_timings_are_queued_and_drained_once(job_cache):
+    @background.instrument_job
+    def analyze(set_progress, window):
+        return window
+
+    @background.instrument_job
+    def skipped(set_progress):
+        raise PreventUpdate
+
+    assert analyze(None, 'window') == 'window'
+    with pytest.raises(PreventUpdate):
+        skipped(None)
+
+    timings = background.drain_job_timings()
+    assert [(name, error) for name, _, error, _ in timings] == [('analyze', False), ('skipped', False)]
+    assert background.drain_job_timings() == []
@@ -0,0 +1,27 @@
+# DR events table formatting tests
+from decimal import Decimal
+
+import pandas as pd
+
+from events_table import format_events_table
+
+
+def test_formats_rows_column_wise():
+    df = pd.DataFrame({
+        'id': [2, 1],
+        'description': ['Peak shave', None],
+        # Postgres NUMERIC columns come back as Decimal
+        'power_target': [Decimal('1234.56'), Decimal('10')],
+        'start_time': ['2026-01-01T13:30:00+00:00', '2026-01-02T08:05:00+00:00'],
+        'end_time': ['2026-01-01T15:00:00+00:00', None],
+    })
+    assert format_events_table(df) == [
+        {'id': 2, 'description': 'Peak shave', 'date': '2026-01-01', 'time': '13:30',
+         'duration': '90 mins', 'power_target': '1234.6'},
+        {'id': 1, 'description': '', 'date': '2026-01-02', 'time': '08:05',
+         'duration': 'Missing', 'power_target': '10.0'},
+    ]
+
+
+def test_empty_frame_has_no_rows():
+    assert format_events_table(pd.DataFrame()) == []
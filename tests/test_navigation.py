@@ -0,0 +1,43 @@
+# Navigation index and cache invalidation tests
+import copy
+import json
+
+import pytest
+
+pytest.importorskip('emerald_ui_components')
+
+import breadcrumbs  # noqa: E402
+import navigation  # noqa: E402
+from components.sidebar import render_nav_menu  # noqa: E402
+
+
+@pytest.fixture
+def restore_nav(monkeypatch):
+    """Undo nav config edits and rebuild after the test."""
+    yield monkeypatch
+    monkeypatch.undo()
+    navigation.NAV_INDEX.rebuild()
+
+
+def test_rebuild_renders_edited_nav(restore_nav):
+    nav = copy.deepcopy(navigation.PERSONA_NAVIGATION['compute_user'])
+    href = nav[0]['items'][0]['href']
+    assert 'Renamed Page' not in json.dumps(render_nav_menu('compute_user', href))
+    breadcrumbs.get_breadcrumb_trie()
+
+    # Rename the Compute User's first page
+    nav[0]['items'][0]['title'] = 'Renamed Page'
+    restore_nav.setitem(navigation.PERSONA_NAVIGATION, 'compute_user', nav)
+    assert 'Renamed Page' not in json.dumps(render_nav_menu('compute_user', href))
+
+    navigation.NAV_INDEX.rebuild()
+    assert navigation.get_page_info(href)['title'] == 'Renamed Page'
+    assert 'Renamed Page' in json.dumps(render_nav_menu('compute_user', href))
+    if href not in {page['path'] for page in breadcrumbs.page_registry.values()}:
+        assert breadcrumbs.get_breadcrumb_trie().resolve(href)[-1] == (href, 'Renamed Page')
+
+
+def test_hrefs_for_falls_back_to_compute_user():
+    index = navigation.NAV_INDEX
+    assert index.hrefs_for('unknown') == index.hrefs_for('compute_user')
+    assert isinstance(index.hrefs_for('internal'), frozenset)
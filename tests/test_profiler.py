@@ -0,0 +1,30 @@
+# Profile store tests on a temp directory
+import os
+
+import profiler
+
+
+def test_paths_skips_profiles_removed_during_scan(tmp_path, monkeypatch):
+    store = profiler.ProfileStore(str(tmp_path), max_profiles=5)
+    for profile_id in ('old', 'new'):
+        (tmp_path / f'{profile_id}.json').write_text('{}')
+    os.utime(tmp_path / 'old.json', (1, 1))
+
+    real_scandir = os.scandir
+
+    def scandir(path):
+        entries = list(real_scandir(path))
+        # Another worker prunes 'new' between the scan and the stat
+        os.remove(tmp_path / 'new.json')
+        return entries
+
+    monkeypatch.setattr(profiler.os, 'scandir', scandir)
+    assert store.paths() == [str(tmp_path / 'old.json')]
+
+
+def test_save_prunes_oldest_beyond_limit(tmp_path):
+    store = profiler.ProfileStore(str(tmp_path), max_profiles=2)
+    for n in range(3):
+        store.save({'id': f'p{n}'})
+        os.utime(tmp_path / f'p{n}.json', (n + 1, n + 1))
+    assert sorted(os.listdir(tmp_path)) == ['p1.json', 'p2.json']
@@ -0,0 +1,41 @@
+# Query cache tests on a temp SQLite file
+from sqlalchemy import Integer, create_engine
+from sqlalchemy.orm import DeclarativeBase, Mapped, Session, mapped_column
+
+import query_cache
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class Target(Base):
+    __tablename__ = 'targets'
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+
+
+def test_invalidate_retires_cached_results(tmp_path):
+    cache = query_cache.QueryCache(str(tmp_path / 'cache.sqlite'), enabled=True)
+    assert cache.get_or_create('ns', 'key', lambda: 1) == 1
+    assert cache.get_or_create('ns', 'key', lambda: 2) == 1
+    cache.invalidate('ns')
+    assert cache.get_or_create('ns', 'key', lambda: 3) == 3
+
+
+def test_invalidate_on_commit_only_after_committed_writes(tmp_path):
+    cache = query_cache.QueryCache(str(tmp_path / 'cache.sqlite'), enabled=True)
+    query_cache.invalidate_on_commit(Target, 'targets', cache)
+    engine = create_engine('sqlite://')
+    Base.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        session.add(Target(id=1))
+        session.flush()
+        session.rollback()
+        session.commit()
+    assert cache.invalidations == 0
+
+    with Session(engine) as session:
+        session.add(Target(id=1))
+        session.commit()
+    assert cache.invalidations == 1